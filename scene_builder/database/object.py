@@ -26,7 +26,27 @@ class ObjectDatabase:
         """
         Initializes the ObjectDatabase.
         """
-        pass
+        # Asset uid -> base64 thumbnail (thumbnails don't change, so each is fetched only once)
+        self._thumbnails: dict[str, str] = {}
+
+    def _fetch_thumbnails(
+        self, asset_uids: list[str], timeout: float | None = None
+    ) -> dict[str, str]:
+        """
+        Returns the thumbnails of the given assets, requesting only those not fetched before.
+
+        Raises on request errors (callers decide how to handle them).
+        """
+        missing = [uid for uid in dict.fromkeys(asset_uids) if uid not in self._thumbnails]
+        if missing:
+            response = requests.post(
+                f"{GDB_API_BASE_URL}/v0/objects/thumbnails",
+                json={"uids": missing},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            self._thumbnails.update(response.json())
+        return {uid: self._thumbnails[uid] for uid in asset_uids if uid in self._thumbnails}
 
     def query(self, query: str, top_k: int = 5) -> list[ObjectBlueprint]:
         """
@@ -51,10 +71,7 @@ class ObjectDatabase:
             response.raise_for_status()
             assets = AssetListAdapter.validate_json(response.text)
             # assets = AssetListAdapter.validate_json(response.text.replace("uid", "source_id"))
-            thumbnails = requests.post(
-                f"{GDB_API_BASE_URL}/v0/objects/thumbnails",
-                json={"uids": [asset.uid for asset in assets]},
-            ).json()
+            thumbnails = self._fetch_thumbnails([asset.uid for asset in assets])
             results = []
             for asset in assets:
                 results.append(
@@ -97,14 +114,7 @@ class ObjectDatabase:
             f"ObjectDatabase.get_asset_thumbnails called with {len(asset_uids)} asset_uids: {asset_uids}"
         )
         try:
-            response = requests.post(
-                f"{GDB_API_BASE_URL}/v0/objects/thumbnails",
-                json={"uids": asset_uids},
-                timeout=30
-            )
-            response.raise_for_status()
-
-            thumbnails = response.json()
+            thumbnails = self._fetch_thumbnails(asset_uids, timeout=30)
             logger.debug(
                 f"ObjectDatabase.get_asset_thumbnails returning {len(thumbnails)} thumbnails"
             )
@@ -11,12 +11,10 @@ import bpy
 import bmesh
 import addon_utils
 import numpy as np
-import yaml
 from matplotlib import pyplot as plt
 from PIL import Image
 from mathutils import Vector
 from mathutils.geometry import tessellate_polygon
-from scipy.spatial.transform import Rotation
 from shapely import affinity
 from shapely.geometry import Polygon
 from shapely.ops import unary_union
@@ -35,7 +33,7 @@ from scene_builder.utils.blender import (
     configure_gpu_backend,
     optimize_scene_for_gpu,
 )
-from scene_builder.utils.conversions import pydantic_to_dict
+from scene_builder.utils.conversions import load_yaml, pydantic_to_dict
 from scene_builder.utils.file import get_filename
 from scene_builder.utils.floorplan import (
     _find_adjacent_wall_segments_from_centers_to_edges,
@@ -43,10 +41,14 @@ from scene_builder.utils.floorplan import (
     _split_edge_by_door_segments,
     calculate_bounds_for_objects,
     find_nearest_wall_point,
-    longest_edge_angle,
     scale_boundary_for_cutout,
 )
-from scene_builder.utils.geometry import calculate_bounds_2d, distance_to_box_2d, polygon_centroid
+from scene_builder.utils.geometry import (
+    calculate_bounds_2d,
+    distance_to_box_2d,
+    longest_edge_angle,
+    polygon_centroid,
+)
 from scene_builder.utils.image import compose_image_grid
 from scene_builder.utils.scene import calculate_scene_bounds
 
@@ -55,6 +57,7 @@ HDRI_FILE_PATH = Path(
 ).expanduser()  # TEMP HACK
 
 BACKGROUND_COLOR = (0.02, 0.02, 0.02, 1.0)
+DEFAULT_OUTPUT_DIR = tempfile.gettempdir()  # resolved once; gettempdir() probes the filesystem
 DEFAULT_DOOR_HEIGHT = 2.5
 DEFAULT_WINDOW_HEIGHT_BOTTOM = 1.0
 DEFAULT_WINDOW_HEIGHT_TOP = 2.5
@@ -63,6 +66,16 @@ DEFAULT_WINDOW_DEPTH = 0.05  # Window thickness into wall (meters)
 OBJECT_PREVIEW_CAMERA_NAME = "ObjectPreviewCamera"
 OBJECT_LABEL_MATERIAL_NAME = "ObjectLabelMaterial"
 
+# glTF importer options for renders that only need geometry (e.g. top-down silhouettes):
+# don't pack images or import WebP textures, and use flat shading. Materials and their node
+# trees are still created, so renders look different from a full import.
+GLTF_GEOMETRY_ONLY_IMPORT_OPTIONS = {
+    "import_pack_images": False,
+    "import_webp_texture": False,
+    "import_shading": "FLAT",
+    "loglevel": 50,
+}
+
 
 @dataclass
 class BlenderObjectState:
@@ -82,7 +95,8 @@ class BlenderSceneTracker:
     def __init__(self):
         # Key: object_id, Value: BlenderObjectState
         self._objects: Dict[str, BlenderObjectState] = {}
-        # Cache: Key: source_id, Value: blender_name of the Empty parent
+        # Cache: Key: source key (see `_source_cache_key()`),
+        #        Value: blender_name of the Empty parent
         self._source_cache: Dict[str, str] = {}
 
     def object_exists_unchanged(self, object_id: str, pos: dict, rot: dict) -> bool:
@@ -144,37 +158,46 @@ class BlenderSceneTracker:
 
         return tuple(self._objects.values())
 
-    def get_cached_empty(self, source_id: str) -> Optional[Any]:
-        """Get cached Empty parent object for a source_id if it exists.
+    def get_cached_empty(self, source_key: str) -> Optional[Any]:
+        """Get cached Empty parent object for a source key if it exists.
 
         Args:
-            source_id: The source_id to look up in cache
+            source_key: The source key to look up in cache (see `_source_cache_key()`)
 
         Returns:
             Blender Empty object if found in cache and still exists, None otherwise
         """
-        if source_id not in self._source_cache:
+        if source_key not in self._source_cache:
             return None
 
-        blender_name = self._source_cache[source_id]
+        blender_name = self._source_cache[source_key]
 
         # Verify the object still exists in Blender
         if blender_name in bpy.data.objects:
             return bpy.data.objects[blender_name]
         else:
             # Object was deleted, clean up cache
-            del self._source_cache[source_id]
+            del self._source_cache[source_key]
             return None
 
-    def register_source_cache(self, source_id: str, blender_name: str):
-        """Register a source_id -> Empty parent mapping in cache.
+    def register_source_cache(self, source_key: str, blender_name: str):
+        """Register a source key -> Empty parent mapping in cache.
 
         Args:
-            source_id: The source identifier (e.g., Objaverse ID)
+            source_key: The source key (see `_source_cache_key()`)
             blender_name: The name of the Empty parent object in Blender
         """
-        self._source_cache[source_id] = blender_name
-        logger.debug(f"Cached source_id '{source_id}' -> Empty '{blender_name}'")
+        self._source_cache[source_key] = blender_name
+        logger.debug(f"Cached source '{source_key}' -> Empty '{blender_name}'")
+
+
+def _source_cache_key(source: str, source_id: str, geometry_only: bool = False) -> str:
+    """Returns the source cache key for an imported asset.
+
+    IDs are only unique within a source, and a geometry-only import can't stand in for a full one.
+    """
+    key = f"{source}:{source_id}"
+    return f"{key}:geometry" if geometry_only else key
 
 
 # Global scene tracker instance
@@ -307,7 +330,31 @@ def suppress_blender_logs(log_file_path: str = BLENDER_LOG_FILE):
         os.close(saved_stderr_fd)
 
 
-def parse_scene_definition(scene_data: dict[str, Any], with_walls: bool = False):
+def _prefetch_object_paths(rooms: list[dict[str, Any]]) -> dict[str, str]:
+    """
+    Resolves the GLB paths of all Objaverse objects in `rooms` concurrently.
+
+    Path lookup/download is I/O-bound and doesn't touch `bpy`, so it runs in one batch (see
+    `objaverse_importer.import_objects()`) ahead of the (main-thread only) glTF imports.
+
+    Returns:
+        Mapping of source_id -> GLB path for the objects that could be resolved
+    """
+    source_ids = {
+        obj.get("source_id")
+        for room_data in rooms
+        for obj in (room_data or {}).get("objects", [])
+        if (obj.get("source") or "").lower() == "objaverse" and obj.get("source_id")
+    }
+    if not source_ids:
+        return {}
+
+    return objaverse_importer.import_objects(list(source_ids))
+
+
+def parse_scene_definition(
+    scene_data: dict[str, Any], with_walls: bool = False, geometry_only: bool = False
+):
     """
     Parses the scene definition dictionary and creates the scene in Blender.
 
@@ -317,6 +364,8 @@ def parse_scene_definition(scene_data: dict[str, Any], with_walls: bool = False)
     Args:
         scene_data: A dictionary representing the scene, loaded from the YAML file.
         with_walls: If True, also create walls for all rooms after layout.
+        geometry_only: If True, import object assets flat-shaded and without packed images
+                       (see `GLTF_GEOMETRY_ONLY_IMPORT_OPTIONS`) and build top-only floors.
     """
     # logger.debug("Parsing scene definition and creating scene in Blender...")
 
@@ -327,8 +376,12 @@ def parse_scene_definition(scene_data: dict[str, Any], with_walls: bool = False)
     with suppress_blender_logs():
         _clear_scene()
 
-    for room_data in scene_data.get("rooms", []):
-        _create_room(room_data)
+    rooms = scene_data.get("rooms", [])
+
+    object_paths = _prefetch_object_paths(rooms)
+
+    for room_data in rooms:
+        _create_room(room_data, geometry_only=geometry_only, object_paths=object_paths)
 
     # Optionally add walls after all floors/objects are created
     if with_walls:
@@ -359,6 +412,7 @@ def parse_room_definition(
     room_data: dict[str, Any],
     clear=True,
     with_walls: Union[bool, str] = False,
+    geometry_only: bool = False,
 ):
     """
     Parses the room definition dictionary and creates the scene in Blender.
@@ -369,6 +423,10 @@ def parse_room_definition(
         with_walls: If True, also create walls for this room after layout.
                     If set to "translucent", creates walls with a translucent material
                     for clearer visual feedback.
+        geometry_only: If True, import object assets flat-shaded and without packed images
+                       (see `GLTF_GEOMETRY_ONLY_IMPORT_OPTIONS`) and build top-only floors.
+                       Shading differs from a full import, so don't use it for renders that
+                       must look final (e.g. visual feedback).
 
     # NOTE: not sure if it's good for `clear` to default to True; (it was for testing)
     # NOTE: I think there's a bug where if `clear=True`, not all assets are recreated at next iteration's `parse_room_definition()` call. this happens after critique's rejection. look into it!
@@ -384,7 +442,7 @@ def parse_room_definition(
             if clear:
                 _clear_scene()
 
-            _create_room(room_data)
+            _create_room(room_data, geometry_only=geometry_only)
 
             if with_walls:
                 try:
@@ -437,28 +495,49 @@ def cleanup_orphan_data(num_passes: int = 3):
 
 def _clear_scene():
     """Clears all objects from the current Blender scene."""
-    with suppress_blender_logs():
-        bpy.ops.object.select_all(action="SELECT")
-        bpy.ops.object.delete()
+    # Remove through `bpy.data` rather than select_all/delete operators (no operator dispatch,
+    # undo push, or context checks), in one batch; only the current scene's objects, since rooms
+    # may live in other scenes (see `SceneSwitcher`)
+    objects = list(bpy.context.scene.objects)
+    meshes = {obj.data for obj in objects if obj.type == "MESH" and obj.data is not None}
+    bpy.data.batch_remove(ids=objects)
+
+    # Remove the meshes only the removed objects used, so repeated parses don't accumulate them;
+    # other data (incl. meshes still used elsewhere) is left alone
+    orphaned_meshes = [mesh for mesh in meshes if mesh.users == 0]
+    if orphaned_meshes:
+        bpy.data.batch_remove(ids=orphaned_meshes)
 
     # Clear object tracking as well
     _scene_tracker.clear_all()
+    _collections_cache.clear()
 
     logger.debug("Cleared existing scene.")
 
 
-def _create_room(room_data: dict[str, Any]):
-    """Creates a representation of a room including floor mesh and objects."""
+def _create_room(
+    room_data: dict[str, Any],
+    geometry_only: bool = False,
+    object_paths: Optional[dict[str, str]] = None,
+):
+    """Creates a representation of a room including floor mesh and objects.
+
+    Args:
+        room_data: Dictionary containing room data
+        geometry_only: Import object assets flat-shaded and without packed images, and build
+                       the floor as a top face only
+        object_paths: Prefetched source_id -> GLB path mapping (see `_prefetch_object_paths()`)
+    """
     if room_data is None:
         logger.warning("room_data is None, skipping room creation")
         return
 
     room_id = room_data.get("id", "unknown_room")
-    logger.debug(f"Creating room: {room_id}")
+    logger.debug("Creating room: {}", room_id)
 
     # Create floor mesh
-    floor_result = _create_floor_mesh(room_data["boundary"], room_id)
-    logger.debug(f"Created floor: {floor_result['status']}")
+    floor_result = _create_floor_mesh(room_data["boundary"], room_id, top_only=geometry_only)
+    logger.debug("Created floor: {}", floor_result["status"])
 
     # Apply floor material
     floor = find_shell(room_data, "floor")
@@ -468,13 +547,29 @@ def _create_room(room_data: dict[str, Any]):
             floor_object_name=floor_result["object_name"],
             boundary=room_data["boundary"],
         )
-        logger.debug(f"Applied material {floor.material_id} to floor")
-    # Create objects in the room
-    for obj_data in room_data.get("objects", []):
+        logger.debug("Applied material {} to floor", floor.material_id)
+    # Create objects in the room; their transforms are applied in one batch afterwards
+    objects = room_data.get("objects", [])
+    transforms = _object_transforms(objects)
+    created_objs = []
+    created_rows = []
+    for row, (obj_data, transform) in enumerate(zip(objects, transforms)):
         try:
-            _create_object(obj_data)
+            blender_obj = _create_object(
+                obj_data,
+                geometry_only=geometry_only,
+                object_paths=object_paths,
+                transform=transform,
+                defer_transform=True,
+            )
         except Exception as e:
             logger.warning(e)
+            continue
+        if blender_obj is not None:
+            created_objs.append(blender_obj)
+            created_rows.append(row)
+
+    _apply_object_transforms(created_objs, transforms[created_rows])
 
 
 def _check_object_duplicate_status(obj_data: dict[str, Any]) -> str:
@@ -497,49 +592,150 @@ def _check_object_duplicate_status(obj_data: dict[str, Any]) -> str:
 
     if _scene_tracker.object_exists_unchanged(object_id, pos, rot):
         logger.debug(
-            f"Skipping duplicate object: {object_name} (id: {object_id}) - unchanged at {pos}"
+            "Skipping duplicate object: {} (id: {}) - unchanged at {}", object_name, object_id, pos
         )
         return "skip_unchanged"
 
     if _scene_tracker.object_exists_but_moved(object_id, pos, rot):
-        logger.debug(f"Object {object_name} (id: {object_id}) has moved - will recreate at {pos}")
+        logger.debug(
+            "Object {} (id: {}) has moved - will recreate at {}", object_name, object_id, pos
+        )
         return "recreate_moved"
 
     return "proceed_new"
 
 
-def _check_object_duplicate_status(obj_data: dict[str, Any]) -> str:
+def _instance_object_hierarchy(root: bpy.types.Object) -> bpy.types.Object:
+    """Create a linked copy of ``root`` and all of its descendants.
+
+    Equivalent to a linked duplicate (``bpy.ops.object.duplicate(linked=True)``) but built
+    from ``bpy.data`` directly: each copy references the original mesh and material
+    datablocks, so no glTF re-parse, selection state, or operator dispatch is needed.
+
+    Args:
+        root: Root object of the previously imported hierarchy
+
+    Returns:
+        The copied root object, linked into the same collections as ``root``
     """
-    Check if object already exists and determine what action to take.
+    copies: dict[str, bpy.types.Object] = {}
+    stack = [root]
+    while stack:
+        src = stack.pop()
+        dup = src.copy()  # shallow: object data (mesh) is shared, not duplicated
+        for collection in src.users_collection:
+            collection.objects.link(dup)
+        if src.parent is not None and src.parent.name in copies:
+            dup.parent = copies[src.parent.name]
+            dup.matrix_parent_inverse = src.matrix_parent_inverse.copy()
+        copies[src.name] = dup
+        stack.extend(src.children)
+
+    return copies[root.name]
+
+
+def _new_empty_object(
+    name: str, location: tuple[float, float, float] = (0.0, 0.0, 0.0)
+) -> bpy.types.Object:
+    """Creates a plain-axes Empty from `bpy.data` and links it to the active collection.
+
+    Equivalent to `bpy.ops.object.empty_add(type="PLAIN_AXES")` without the operator's selection,
+    undo, and context overhead.
+    """
+    empty = bpy.data.objects.new(name, None)
+    empty.empty_display_type = "PLAIN_AXES"
+    bpy.context.collection.objects.link(empty)
+    empty.location = location
+    return empty
+
+
+# Default transform components for objects that omit them
+_ZERO_VECTOR3 = {"x": 0, "y": 0, "z": 0}
+
+
+def _object_transforms(objects: list[dict[str, Any]]) -> np.ndarray:
+    """
+    Packs the transforms of `objects` into a single (N, 9) float32 array.
+
+    Columns are location (x, y, z), rotation in radians (x, y, z), and scale (x, y, z), so a room's
+    transforms are converted once up front instead of per object.
 
     Args:
-        obj_data: Dictionary containing object data
+        objects: Object dictionaries (or `Object` models) with "position" and "rotation" in degrees
 
     Returns:
-        String indicating status: "skip_unchanged", "recreate_moved", or "proceed_new"
+        Array with one row per object
     """
-    object_id = obj_data.get("id")
-    object_name = obj_data.get("name", "Unnamed Object")
-    pos = obj_data.get("position", {"x": 0, "y": 0, "z": 0})
-    rot = obj_data.get("rotation", {"x": 0, "y": 0, "z": 0})
+    objects = [pydantic_to_dict(obj) if isinstance(obj, Object) else obj for obj in objects]
+    count = len(objects)
+
+    transforms = np.ones((count, 9), dtype=np.float32)
+    transforms[:, :6] = np.fromiter(
+        (
+            vector[axis]
+            for obj in objects
+            for vector in (
+                obj.get("position", _ZERO_VECTOR3),
+                obj.get("rotation", _ZERO_VECTOR3),
+            )
+            for axis in ("x", "y", "z")
+        ),
+        dtype=np.float32,
+        count=count * 6,
+    ).reshape(count, 6)
+    transforms[:, 3:6] = np.radians(transforms[:, 3:6])
 
-    if not object_id:
-        return "proceed_new"
+    # NOTE: scale is left at (1, 1, 1). I think LLMs think scale to be a size (dimensions)
+    #       attribute in meters, not the scaling factor (0-1.0 float). Probs bc they're not fed
+    #       with dims.  # TEMP HACK
+    return transforms
 
-    if _scene_tracker.object_exists_unchanged(object_id, pos, rot):
-        logger.debug(
-            f"Skipping duplicate object: {object_name} (id: {object_id}) - unchanged at {pos}"
-        )
-        return "skip_unchanged"
 
-    if _scene_tracker.object_exists_but_moved(object_id, pos, rot):
-        logger.debug(f"Object {object_name} (id: {object_id}) has moved - will recreate at {pos}")
-        return "recreate_moved"
+def _apply_object_transforms(blender_objs: list[bpy.types.Object], transforms: np.ndarray):
+    """Batched `_apply_object_transform()`: one `foreach_set` per property for all objects.
 
-    return "proceed_new"
+    Args:
+        blender_objs: Object roots to transform
+        transforms: Matching `_object_transforms()` rows, one per object
+    """
+    if not blender_objs:
+        return
+
+    # `foreach_set` works on collections, so gather the objects in a temporary one; it's never
+    # linked to a scene, so scene membership is unaffected
+    batch = bpy.data.collections.new("TransformBatch")
+    try:
+        for blender_obj in blender_objs:
+            batch.objects.link(blender_obj)
+        batch.objects.foreach_set("location", transforms[:, 0:3].ravel())
+        batch.objects.foreach_set("rotation_euler", transforms[:, 3:6].ravel())
+        batch.objects.foreach_set("scale", transforms[:, 6:9].ravel())
+        # `foreach_set` skips the RNA update callbacks, so tag the objects for re-evaluation
+        for blender_obj in blender_objs:
+            blender_obj.update_tag(refresh={"OBJECT"})
+    finally:
+        bpy.data.collections.remove(batch)
 
 
-def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
+def _apply_object_transform(blender_obj: bpy.types.Object, transform: np.ndarray):
+    """Sets an object's location, rotation, and scale from a `_object_transforms()` row.
+
+    The Euler rotation is assigned as is: object roots are unrotated Empties (or copies of one),
+    so there is no original rotation to compose with.
+    """
+    blender_obj.location = transform[0:3]
+    blender_obj.rotation_euler = transform[3:6]
+    blender_obj.scale = transform[6:9]
+
+
+def _create_object(
+    obj_data: dict[str, Any],
+    parent_location: str = "origin",
+    geometry_only: bool = False,
+    object_paths: Optional[dict[str, str]] = None,
+    transform: Optional[np.ndarray] = None,
+    defer_transform: bool = False,
+) -> Optional[bpy.types.Object]:
     """
     Creates a single object in the Blender scene.
     Raises an IOError if the object cannot be imported.
@@ -548,6 +744,15 @@ def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
         obj_data: Dictionary containing object data
         parent_location: Strategy for placing the parent Empty object.
                         Options: "first_object", "median", "origin"
+        geometry_only: If True, skip texture packing and smooth shading on import
+                       (see `GLTF_GEOMETRY_ONLY_IMPORT_OPTIONS`).
+        object_paths: Prefetched source_id -> GLB path mapping for Objaverse objects (optional)
+        transform: This object's row of `_object_transforms()` (optional; computed if omitted)
+        defer_transform: If True, leave the transform to the caller (e.g. a batched
+                         `_apply_object_transforms()`)
+
+    Returns:
+        The created root object, or None if no object was created
     """
     if isinstance(obj_data, Object):
         obj_data = pydantic_to_dict(obj_data)
@@ -555,12 +760,8 @@ def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
     # Load data from object
     object_name = obj_data.get("name", "Unnamed Object")
     object_id = obj_data["id"]
-    pos = obj_data.get("position", {"x": 0, "y": 0, "z": 0})
-    rot = obj_data.get("rotation", {"x": 0, "y": 0, "z": 0})
-    # scl = obj_data.get("scale", {"x": 1, "y": 1, "z": 1})
-    # NOTE: I think LLMs think scale to be a size (dimensions) attribute in meters,
-    #       not the scaling factor (0-1.0 float). Probs bc they're not fed with dims.
-    scl = {"x": 1, "y": 1, "z": 1}  # TEMP HACK
+    if transform is None:
+        transform = _object_transforms([obj_data])[0]
 
     # Check for duplicates and determine action
     status = _check_object_duplicate_status(obj_data)
@@ -568,61 +769,26 @@ def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
         return
     # TODO: Handle "recreate_moved" case if needed (remove old Blender object)
 
-    logger.debug(f"Creating object: {object_name} (id: {object_id})")
+    logger.debug("Creating object: {} (id: {})", object_name, object_id)
 
     blender_obj = None
     source_id = obj_data.get("source_id")
+    source_key = _source_cache_key(obj_data.get("source"), source_id, geometry_only)
 
-    # Check if we've already imported this source_id
+    # Check if we've already imported this asset
     if source_id:
-        cached_empty = _scene_tracker.get_cached_empty(source_id)
+        cached_empty = _scene_tracker.get_cached_empty(source_key)
         if cached_empty:
-            logger.debug(f"Reusing cached model for source_id: {source_id}")
-
-            # Duplicate the entire cached hierarchy via selection, linking mesh data
-            with suppress_blender_logs():
-                # Deselect everything
-                bpy.ops.object.select_all(action="DESELECT")
-
-                # Ensure the root is selected and active
-                cached_empty.select_set(True)
-                bpy.context.view_layer.objects.active = cached_empty
-
-                # Select all descendants (recursive) using Blender operator
-                bpy.ops.object.select_grouped(type="CHILDREN_RECURSIVE", extend=True)
-
-                # Snapshot objects before duplication to identify new ones
-                pre_objs = set(bpy.data.objects)
+            logger.debug("Reusing cached model for source_id: {}", source_id)
 
-                # Perform a linked duplicate so meshes share data
-                bpy.ops.object.duplicate(linked=True)
-
-            # Identify duplicated objects and pick the duplicated root
-            post_objs = set(bpy.data.objects)
-            new_objs = list(post_objs - pre_objs)
-            if not new_objs:
-                raise RuntimeError("Linked duplication produced no new objects.")
-
-            dup_roots = [o for o in new_objs if (o.parent is None) or (o.parent not in new_objs)]
-            if not dup_roots:
-                # Fallback: use any new object; hierarchy may be flat
-                dup_roots = [new_objs[0]]
-
-            blender_obj = dup_roots[0]
+            # Instance the cached hierarchy; copies share the imported mesh/material datablocks
+            blender_obj = _instance_object_hierarchy(cached_empty)
             blender_obj.name = object_name
 
             # Skip to transformation section
-            # (Set position, rotation, and scale)
-            blender_obj.location = (pos["x"], pos["y"], pos["z"])
-            blender_obj.scale = (scl["x"], scl["y"], scl["z"])
-
-            # Combine the original rotation with the rotation from the scene definition.
-            original_rotation = Rotation.from_euler("xyz", blender_obj.rotation_euler)
-            new_rotation = Rotation.from_euler("xyz", [rot["x"], rot["y"], rot["z"]], degrees=True)
-            combined_rotation = new_rotation * original_rotation
-
-            # Apply the combined rotation.
-            blender_obj.rotation_euler = combined_rotation.as_euler("xyz")
+            # (Set position, rotation, and scale; this overwrites the copied root's transform)
+            if not defer_transform:
+                _apply_object_transform(blender_obj, transform)
 
             # Register the created object in tracker
             if object_id and blender_obj:
@@ -630,16 +796,18 @@ def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
                     obj_data,
                     blender_obj.name,
                 )
-                logger.debug(f"Registered object in tracker: {object_name} (id: {object_id})")
+                logger.debug("Registered object in tracker: {} (id: {})", object_name, object_id)
 
-            return
+            return blender_obj
 
     if obj_data.get("source").lower() == "objaverse":
         if not source_id:
             raise ValueError(f"Object '{object_name}' has source 'objaverse' but no 'source_id'.")
 
-        # Import the object from Objaverse
-        object_path = objaverse_importer.import_object(source_id)
+        # Import the object from Objaverse (unless its path was prefetched)
+        object_path = (object_paths or {}).get(source_id) or objaverse_importer.import_object(
+            source_id
+        )
 
     elif obj_data.get("source") == "test_asset":
         object_path = test_asset_importer.import_test_asset(obj_data.get("source_id"))
@@ -666,7 +834,8 @@ def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
                 bpy.ops.object.select_all(action="DESELECT")
 
                 # Import the GLTF file - imported objects will be selected
-                bpy.ops.import_scene.gltf(filepath=object_path)
+                import_options = GLTF_GEOMETRY_ONLY_IMPORT_OPTIONS if geometry_only else {}
+                bpy.ops.import_scene.gltf(filepath=object_path, **import_options)
 
             # Get only top-level imported objects (no parents) to preserve hierarchy
             imported_objects = [obj for obj in bpy.context.selected_objects if obj.parent is None]
@@ -705,10 +874,7 @@ def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
                 empty_location = (0, 0, 0)
 
             # Create Empty at the calculated location
-            with suppress_blender_logs():
-                bpy.ops.object.empty_add(type="PLAIN_AXES", location=empty_location)
-            blender_obj = bpy.context.active_object
-            blender_obj.name = object_name
+            blender_obj = _new_empty_object(object_name, location=empty_location)
 
             # Parent all imported objects to the Empty
             for obj in imported_objects:
@@ -716,7 +882,7 @@ def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
 
             # Register this Empty in the source cache for future reuse
             if source_id:
-                _scene_tracker.register_source_cache(source_id, blender_obj.name)
+                _scene_tracker.register_source_cache(source_key, blender_obj.name)
 
         except Exception as e:
             raise IOError(
@@ -729,16 +895,8 @@ def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
         )
 
     # Set position, rotation, and scale
-    blender_obj.location = (pos["x"], pos["y"], pos["z"])
-    blender_obj.scale = (scl["x"], scl["y"], scl["z"])
-
-    # Combine the original rotation with the rotation from the scene definition.
-    original_rotation = Rotation.from_euler("xyz", blender_obj.rotation_euler)
-    new_rotation = Rotation.from_euler("xyz", [rot["x"], rot["y"], rot["z"]], degrees=True)
-    combined_rotation = new_rotation * original_rotation
-
-    # Apply the combined rotation.
-    blender_obj.rotation_euler = combined_rotation.as_euler("xyz")
+    if not defer_transform:
+        _apply_object_transform(blender_obj, transform)
 
     # Register the created object in tracker
     if object_id and blender_obj:
@@ -746,7 +904,141 @@ def _create_object(obj_data: dict[str, Any], parent_location: str = "origin"):
             obj_data,
             blender_obj.name,
         )
-        logger.debug(f"Registered object in tracker: {object_name} (id: {object_id})")
+        logger.debug("Registered object in tracker: {} (id: {})", object_name, object_id)
+
+    return blender_obj
+
+
+def _build_floor_arrays(
+    boundary: list[dict[str, float]],
+    floor_thickness_m: float = 0.1,
+    origin: str = "center",
+    top_only: bool = False,
+) -> Optional[dict[str, Any]]:
+    """
+    Builds floor geometry (vertices, faces, origin) from a room boundary.
+
+    This is the pure-geometry stage of `_create_floor_mesh()`; it does not touch `bpy`.
+
+    Args:
+        boundary: List of Vector2 points from room.boundary [{"x": float, "y": float}, ...]
+        floor_thickness_m: Thickness of the floor in meters (default: 0.1)
+        origin: Origin placement - "center" or "min" (default: "center")
+        top_only: Build only the top face, skipping the bottom face and side walls
+
+    Returns:
+        Dictionary with "vertices_2d", "verts", "faces", "origin_offset", and "area" (polygon
+        area in m^2), or None if the boundary has fewer than 3 distinct points
+    """
+    # Convert boundary points to 2D vertices
+    # Handle both Vector2 objects and dictionaries
+    vertices_2d = []
+    for point in boundary:
+        if hasattr(point, "x"):  # Vector2 object
+            vertices_2d.append((point.x, point.y))
+        else:  # Dictionary format
+            vertices_2d.append((point["x"], point["y"]))
+
+    # Drop repeated consecutive points (incl. an explicit closing point); they only yield
+    # degenerate faces
+    deduped_2d = [v for i, v in enumerate(vertices_2d) if i == 0 or v != vertices_2d[i - 1]]
+    if len(deduped_2d) > 1 and deduped_2d[0] == deduped_2d[-1]:
+        deduped_2d.pop()
+    num_verts = len(deduped_2d)
+    if num_verts < 3:
+        return None
+
+    # Orient the boundary counter-clockwise so face winding (and thus normals) is known up
+    # front: top faces point +Z, bottom faces -Z, side quads outward
+    xy = np.asarray(deduped_2d, dtype=np.float64)
+    x, y = xy[:, 0], xy[:, 1]
+    signed_area = 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    if signed_area < 0:
+        xy = xy[::-1]
+
+    # Top face: triangulate directly rather than attempting an ngon first
+    if num_verts == 3:
+        top_faces = np.array([[0, 1, 2]])
+    else:
+        try:
+            top_faces = np.array(
+                tessellate_polygon([[Vector((px, py, 0.0)) for px, py in xy.tolist()]]),
+                dtype=np.int64,
+            ).reshape(-1, 3)
+            # Tessellation does not guarantee winding; flip clockwise triangles to CCW
+            a, b, c = xy[top_faces[:, 0]], xy[top_faces[:, 1]], xy[top_faces[:, 2]]
+            cross = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (
+                c[:, 0] - a[:, 0]
+            )
+            top_faces[cross < 0, 1:] = top_faces[cross < 0, :0:-1]
+        except Exception as tess_error:
+            logger.debug(f"Tessellation failed: {tess_error}")
+            # Fallback: create a simple triangular fan
+            fan = np.arange(1, num_verts - 1)
+            top_faces = np.column_stack([np.zeros_like(fan), fan, fan + 1])
+
+    # Fill the whole vertex buffer in one pass: top ring at z=0 is [0, n), and the bottom ring
+    # (only if thickness > 0) is [n, 2n)
+    has_thickness = floor_thickness_m > 0 and not top_only
+    verts = np.zeros((2 * num_verts if has_thickness else num_verts, 3), dtype=np.float64)
+    verts[:num_verts, :2] = xy
+    faces = top_faces.tolist()
+    if has_thickness:
+        verts[num_verts:, :2] = xy
+        verts[num_verts:, 2] = -floor_thickness_m
+        # Bottom faces mirror the top faces (reversed order for opposite normal)
+        faces += (top_faces[:, ::-1] + num_verts).tolist()
+        # Side quads wound (top_i, bottom_i, bottom_j, top_j) so they face outward
+        top_i = np.arange(num_verts)
+        top_j = np.roll(top_i, -1)
+        side_quads = np.column_stack([top_i, top_i + num_verts, top_j + num_verts, top_j])
+        faces += side_quads.tolist()
+
+    # Object origin: shift the vertices so the bounds center sits at the object origin; the
+    # object is then moved by the same amount (what origin_set(center="BOUNDS") does, minus the
+    # operator dispatch and selection changes)
+    origin_offset = (0.0, 0.0, 0.0)
+    if origin in ("center", "min"):
+        center = (verts.min(axis=0) + verts.max(axis=0)) * 0.5
+        verts -= center
+        origin_offset = tuple(center.tolist())
+
+    return {
+        "vertices_2d": vertices_2d,
+        "verts": verts,
+        "faces": faces,
+        "origin_offset": origin_offset,
+        "area": abs(signed_area),
+    }
+
+
+def _upload_mesh_arrays(mesh: bpy.types.Mesh, verts, faces) -> None:
+    """
+    Fills an empty mesh from vertex and face arrays using bulk `foreach_set` uploads.
+
+    Equivalent to `mesh.from_pydata(verts, [], faces)` without walking Python tuples per element.
+
+    Args:
+        mesh: Empty mesh datablock to fill
+        verts: Sequence or (N, 3) array of vertex coordinates
+        faces: Sequence of vertex index sequences, one per polygon
+    """
+    verts_np = np.asarray(verts, dtype=np.float32).reshape(-1, 3)
+    loop_totals = np.fromiter((len(face) for face in faces), dtype=np.int32, count=len(faces))
+    loop_starts = np.zeros(len(faces), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+    loop_vertex_indices = np.fromiter(
+        (i for face in faces for i in face), dtype=np.int32, count=int(loop_totals.sum())
+    )
+
+    mesh.vertices.add(len(verts_np))
+    mesh.vertices.foreach_set("co", verts_np.ravel())
+    mesh.loops.add(len(loop_vertex_indices))
+    mesh.loops.foreach_set("vertex_index", loop_vertex_indices)
+    # Polygon sizes follow from consecutive loop starts (`loop_total` is read-only since 4.0)
+    mesh.polygons.add(len(faces))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    mesh.update(calc_edges=True)
 
 
 def _create_floor_mesh(
@@ -754,6 +1046,7 @@ def _create_floor_mesh(
     room_id: str,
     floor_thickness_m: float = 0.1,
     origin: str = "center",
+    top_only: bool = False,
 ) -> dict[str, Any]:
     """
     Args:
@@ -761,6 +1054,8 @@ def _create_floor_mesh(
         room_id: Room identifier for naming
         floor_thickness_m: Thickness of the floor in meters (default: 0.1)
         origin: Origin placement - "center" or "min" (default: "center")
+        top_only: Build only the top face (half the vertices; no bottom or side walls). Top-down
+                  renders can't see the underside, so they should set this.
 
     Returns:
         Dictionary with creation status and metadata
@@ -788,6 +1083,14 @@ def _create_floor_mesh(
             "message": f"Floor '{floor_name}' already exists",
         }
 
+    floor_arrays = _build_floor_arrays(boundary, floor_thickness_m, origin, top_only)
+    if floor_arrays is None:
+        return {
+            "status": "error",
+            "message": f"Room {room_id}: At least 3 distinct boundary points required",
+        }
+    vertices_2d = floor_arrays["vertices_2d"]
+
     # Ensure floor collection exists
     collection = _ensure_collection("Floor")
 
@@ -798,131 +1101,20 @@ def _create_floor_mesh(
     # Link to collection
     collection.objects.link(floor_obj)
 
-    # Create bmesh instance
-    bm = bmesh.new()
+    # Face normals follow from the winding set up in `_build_floor_arrays()`
+    _upload_mesh_arrays(mesh, floor_arrays["verts"], floor_arrays["faces"])
+    floor_obj.location = floor_arrays["origin_offset"]
 
-    try:
-        # Convert boundary points to 3D vertices (z=0 for top face)
-        # Handle both Vector2 objects and dictionaries
-        vertices_2d = []
-        for point in boundary:
-            if hasattr(point, "x"):  # Vector2 object
-                vertices_2d.append((point.x, point.y))
-            else:  # Dictionary format
-                vertices_2d.append((point["x"], point["y"]))
-        verts_3d = [(x, y, 0.0) for x, y in vertices_2d]
-
-        # Create vertices in bmesh
-        bmesh_verts = []
-        for vert in verts_3d:
-            bmesh_verts.append(bm.verts.new(vert))
-
-        # Ensure face indices are valid
-        bm.verts.ensure_lookup_table()
-
-        # Create the top face using all vertices
-        try:
-            top_face = bm.faces.new(bmesh_verts)
-            top_face.normal_update()
-        except ValueError as e:
-            # If direct face creation fails, try triangulation
-            logger.debug(f"Direct face creation failed: {e}. Attempting triangulation...")
-
-            # Convert to mathutils Vectors for tessellation
-            vectors = [Vector(v) for v in verts_3d]
-
-            # Tessellate the polygon
-            try:
-                tessellated = tessellate_polygon([vectors])
-
-                # Create faces from tessellation
-                for tri in tessellated:
-                    try:
-                        face_verts = [bmesh_verts[i] for i in tri]
-                        bm.faces.new(face_verts)
-                    except (ValueError, IndexError):
-                        continue
-
-            except Exception as tess_error:
-                logger.debug(f"Tessellation failed: {tess_error}")
-                # Fallback: create a simple triangular fan
-                for i in range(1, len(bmesh_verts) - 1):
-                    try:
-                        face_verts = [
-                            bmesh_verts[0],
-                            bmesh_verts[i],
-                            bmesh_verts[i + 1],
-                        ]
-                        bm.faces.new(face_verts)
-                    except ValueError as ve:
-                        logger.debug(f"Failed to create fallback triangle face: {ve}")
-                        continue
-
-        # Create bottom face and side walls if thickness > 0
-        if floor_thickness_m > 0:
-            # Duplicate vertices for bottom face
-            bottom_verts = []
-            for x, y, _ in verts_3d:
-                bottom_verts.append(bm.verts.new((x, y, -floor_thickness_m)))
-
-            bm.verts.ensure_lookup_table()
-
-            # Create bottom face (reversed order for correct normal)
-            try:
-                bottom_face = bm.faces.new(reversed(bottom_verts))
-                bottom_face.normal_update()
-            except ValueError:
-                # Fallback triangulation for bottom face
-                for i in range(1, len(bottom_verts) - 1):
-                    face_verts = [bottom_verts[0], bottom_verts[i + 1], bottom_verts[i]]
-                    bm.faces.new(face_verts)
-
-            # Create side walls
-            num_verts = len(bmesh_verts)
-            for i in range(num_verts):
-                next_i = (i + 1) % num_verts
-                # Create quad face for each side
-                side_face = bm.faces.new(
-                    [
-                        bmesh_verts[i],
-                        bmesh_verts[next_i],
-                        bottom_verts[next_i],
-                        bottom_verts[i],
-                    ]
-                )
-                side_face.normal_update()
-
-        # Recalculate normals
-        bm.faces.ensure_lookup_table()
-        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
-
-        # Update mesh
-        bm.to_mesh(mesh)
-        mesh.update()
-
-        # Generate UV coordinates for texturing
-        bpy.context.view_layer.objects.active = floor_obj
-        with suppress_blender_logs():
-            bpy.ops.object.select_all(action="DESELECT")
-            floor_obj.select_set(True)
-            bpy.ops.object.mode_set(mode="EDIT")
-            bpy.ops.mesh.select_all(action="SELECT")
-            bpy.ops.uv.unwrap(method="ANGLE_BASED", margin=0.001)
-            bpy.ops.object.mode_set(mode="OBJECT")
-        # logger.debug(f"Generated UV coordinates for floor: {floor_name}")
-
-    finally:
-        bm.free()
-
-    # Set object origin
+    # Generate UV coordinates for texturing
     bpy.context.view_layer.objects.active = floor_obj
-    bpy.ops.object.select_all(action="DESELECT")
-    floor_obj.select_set(True)
-
-    if origin == "center":
-        bpy.ops.object.origin_set(type="ORIGIN_CENTER_OF_MASS", center="BOUNDS")
-    elif origin == "min":
-        bpy.ops.object.origin_set(type="ORIGIN_GEOMETRY", center="BOUNDS")
+    with suppress_blender_logs():
+        bpy.ops.object.select_all(action="DESELECT")
+        floor_obj.select_set(True)
+        bpy.ops.object.mode_set(mode="EDIT")
+        bpy.ops.mesh.select_all(action="SELECT")
+        bpy.ops.uv.unwrap(method="ANGLE_BASED", margin=0.001)
+        bpy.ops.object.mode_set(mode="OBJECT")
+    # logger.debug(f"Generated UV coordinates for floor: {floor_name}")
 
     # Calculate bounds
     bounds = calculate_bounds_2d(vertices_2d)
@@ -936,9 +1128,10 @@ def _create_floor_mesh(
         "room_id": room_id,
         "vertex_count": len(vertices_2d),
         "face_count": len(mesh.polygons),
-        "thickness_m": floor_thickness_m,
+        "thickness_m": 0.0 if top_only else floor_thickness_m,
         "origin_mode": origin,
         "bounds": bounds,
+        "area_m2": floor_arrays["area"],
     }
 
     return result
@@ -1232,6 +1425,10 @@ def create_window_from_boundary(
     return result
 
 
+# Collections returned by `_ensure_collection()`: scene-specific name -> collection
+_collections_cache: Dict[str, bpy.types.Collection] = {}
+
+
 def _ensure_collection(collection_name: str):
     """Ensures a collection exists in the current scene and returns it.
 
@@ -1242,20 +1439,33 @@ def _ensure_collection(collection_name: str):
     # Create scene-specific collection name to avoid conflicts
     scene_specific_name = f"{collection_name}_{current_scene.name}"
 
+    cached = _collections_cache.get(scene_specific_name)
+    if cached is not None:
+        try:
+            if cached.name == scene_specific_name:
+                return cached
+        except ReferenceError:
+            # Removed from bpy.data since it was cached
+            pass
+        del _collections_cache[scene_specific_name]
+
     # Check if scene-specific collection already exists in current scene
     for collection in current_scene.collection.children:
         if collection.name == scene_specific_name:
+            _collections_cache[scene_specific_name] = collection
             return collection
 
     # Check if it exists globally but not linked to current scene
     if scene_specific_name in bpy.data.collections:
         existing_collection = bpy.data.collections[scene_specific_name]
         current_scene.collection.children.link(existing_collection)
+        _collections_cache[scene_specific_name] = existing_collection
         return existing_collection
 
     # Create new scene-specific collection
     collection = bpy.data.collections.new(scene_specific_name)
     current_scene.collection.children.link(collection)
+    _collections_cache[scene_specific_name] = collection
     logger.debug(f"Created collection '{scene_specific_name}' in scene '{current_scene.name}'")
     return collection
 
@@ -1405,7 +1615,9 @@ def load_template(path: str, clear_scene: bool):
     logger.debug(f"Loaded template from {path}")
 
 
-def save_scene(filepath: str, scene: str = None, exclude_grid: bool = True):
+def save_scene(
+    filepath: str, scene: str = None, exclude_grid: bool = True, transient: bool = False
+):
     """
     Saves a Blender scene to a .blend file.
 
@@ -1413,6 +1625,9 @@ def save_scene(filepath: str, scene: str = None, exclude_grid: bool = True):
         filepath: Path to save the .blend file.
         scene: Name of the scene to save. If None, uses current scene.
         exclude_grid: If True, temporarily removes grid objects before saving.
+        transient: If True, the file is an intermediate (e.g., in a save-then-render loop): it is
+                   written uncompressed, without packing images, and as a copy (the session's
+                   current file path is left unchanged).
     """
     if not filepath.endswith(".blend"):
         filepath += ".blend"
@@ -1436,12 +1651,14 @@ def save_scene(filepath: str, scene: str = None, exclude_grid: bool = True):
         cleanup_orphan_data()
 
         # Pack all external images into the .blend file
-        try:
-            with suppress_blender_logs():
-                bpy.ops.file.pack_all()
-            # logger.debug("Packed all external images into .blend file")
-        except Exception as e:
-            logger.debug(f"Warning: Could not pack images: {e}")
+        # (transient files are only read back in this session, where the images are available)
+        if not transient:
+            try:
+                with suppress_blender_logs():
+                    bpy.ops.file.pack_all()
+                # logger.debug("Packed all external images into .blend file")
+            except Exception as e:
+                logger.debug(f"Warning: Could not pack images: {e}")
 
         # Ensure viewport is set to Material Preview before saving
         for area in bpy.context.screen.areas:
@@ -1452,7 +1669,11 @@ def save_scene(filepath: str, scene: str = None, exclude_grid: bool = True):
                         break
 
         with suppress_blender_logs():
-            bpy.ops.wm.save_as_mainfile(filepath=filepath)
+            if transient:
+                # NOTE: pass `compress` explicitly; otherwise it follows the loaded file's setting
+                bpy.ops.wm.save_as_mainfile(filepath=filepath, compress=False, copy=True)
+            else:
+                bpy.ops.wm.save_as_mainfile(filepath=filepath)
         logger.debug(f"Scene saved to {filepath}")
 
         # Re-link grid objects if they were temporarily removed
@@ -1538,6 +1759,56 @@ def debug_scene_summary(max_other: int = 20) -> dict:
     return summary
 
 
+def _probe_render_engines() -> frozenset[str]:
+    """Returns the identifiers of the render engines offered by this Blender build."""
+    # NOTE: the RNA engine enum is dynamic; without a UI context (e.g., `bpy` as a module) it only
+    #       lists the active engine, so use the built-in engines plus any registered add-on ones
+    #       (e.g., Cycles)
+    engines = {"BLENDER_EEVEE_NEXT", "EEVEE", "BLENDER_WORKBENCH", "CYCLES"}
+    engines.update(
+        engine_cls.bl_idname
+        for engine_cls in bpy.types.RenderEngine.__subclasses__()
+        if getattr(engine_cls, "bl_idname", None)
+    )
+    return frozenset(engines)
+
+
+# Engine availability is fixed for the process; probe once at import
+AVAILABLE_RENDER_ENGINES = _probe_render_engines()
+DEFAULT_RENDER_ENGINE = next(
+    (
+        candidate
+        for candidate in ("BLENDER_EEVEE_NEXT", "EEVEE", "CYCLES", "BLENDER_WORKBENCH")
+        if candidate in AVAILABLE_RENDER_ENGINES
+    ),
+    None,
+)
+
+
+# Per-scene cache of the render rig: scene name -> {role: Blender object name}
+_render_rigs: Dict[str, Dict[str, str]] = {}
+
+
+def _get_cached_rig_object(role: str) -> Optional[bpy.types.Object]:
+    """Return the cached rig object for ``role`` in the current scene, if it still exists."""
+    scene = bpy.context.scene
+    name = _render_rigs.get(scene.name, {}).get(role)
+    if not name:
+        return None
+
+    obj = bpy.data.objects.get(name)
+    if obj is None or scene.objects.get(obj.name) is None:
+        # Removed since it was cached (e.g., by `_clear_scene()`)
+        _render_rigs[scene.name].pop(role, None)
+        return None
+    return obj
+
+
+def _cache_rig_object(role: str, obj: bpy.types.Object):
+    """Remember ``obj`` as the current scene's rig object for ``role``."""
+    _render_rigs.setdefault(bpy.context.scene.name, {})[role] = obj.name
+
+
 def _configure_output_image(format: str, resolution: int):
     format = format.upper()
     mapping = {"JPG": "JPEG"}
@@ -1553,31 +1824,13 @@ def _configure_output_image(format: str, resolution: int):
 def _configure_render_settings(engine: str = None, samples: int = 256, enable_gpu: bool = True):
     """Selects a compatible render engine and configures render settings."""
 
-    available_engines = ["BLENDER_EEVEE_NEXT", "EEVEE", "BLENDER_WORKBENCH", "CYCLES"]
-    # try:
-    #     engine_prop = bpy.context.scene.render.bl_rna.properties["engine"]
-    #     available_engines = [item.identifier for item in engine_prop.enum_items]
-    # except Exception:
-    #     available_engines = []
-
     # Use specified engine if provided and available
-    if engine and engine in available_engines:
+    if engine and engine in AVAILABLE_RENDER_ENGINES:
         bpy.context.scene.render.engine = engine
-    else:
-        # Fallback to preferred engines
-        preferred_engines = [
-            "BLENDER_EEVEE_NEXT",
-            "EEVEE",
-            "CYCLES",
-            "BLENDER_WORKBENCH",
-        ]
-        for candidate in preferred_engines:
-            if candidate in available_engines:
-                bpy.context.scene.render.engine = candidate
-                break
-        else:
-            # Fallback to whatever is currently set if preferences are unavailable
-            pass
+    elif DEFAULT_RENDER_ENGINE:
+        # Fallback to preferred engine
+        bpy.context.scene.render.engine = DEFAULT_RENDER_ENGINE
+    # Otherwise keep whatever is currently set if preferences are unavailable
 
     # Configure samples based on selected engine
     if samples is not None:
@@ -1588,14 +1841,64 @@ def _configure_render_settings(engine: str = None, samples: int = 256, enable_gp
         # elif bpy.context.scene.render.engine in ["BLENDER_EEVEE_NEXT", "EEVEE"]:
         bpy.context.scene.eevee.taa_render_samples = samples
 
+    # Keep render data (e.g. Cycles' BVH) around between renders of the same scene
+    bpy.context.scene.render.use_persistent_data = True
+
     # Enable shadows for EEVEE engines
     if bpy.context.scene.render.engine in ["BLENDER_EEVEE_NEXT", "EEVEE"]:
         bpy.context.scene.eevee.use_shadows = True
 
     # Enable GPU rendering for Cycles if requested
     if enable_gpu and bpy.context.scene.render.engine == "CYCLES":
-        configure_gpu_backend()
-        optimize_scene_for_gpu(bpy.context.scene)
+        if configure_gpu_backend():
+            optimize_scene_for_gpu(bpy.context.scene)
+
+
+def _scene_objects_using(datablocks, scene: bpy.types.Scene = None) -> list[bpy.types.Object]:
+    """Returns the objects in ``scene`` whose data is one of ``datablocks``.
+
+    Looks up users of a small datablock collection (e.g. ``bpy.data.cameras``) via
+    `bpy.data.user_map()` instead of iterating every scene object and checking its type.
+
+    Args:
+        datablocks: Collection of object data blocks, e.g. ``bpy.data.cameras``
+        scene: Scene to restrict results to. If None, uses the current scene.
+    """
+    if not datablocks:
+        return []
+
+    scene = scene or bpy.context.scene
+    user_map = bpy.data.user_map(subset=list(datablocks), value_types={"OBJECT"})
+    return [
+        obj
+        for users in user_map.values()
+        for obj in users
+        if scene.objects.get(obj.name) is not None
+    ]
+
+
+def _remove_scene_cameras(scene: bpy.types.Scene = None):
+    """Removes all camera objects from ``scene`` (current scene by default)."""
+    for camera in _scene_objects_using(bpy.data.cameras, scene):
+        camera_data = camera.data
+        bpy.data.objects.remove(camera, do_unlink=True)
+        if camera_data.users == 0:
+            bpy.data.cameras.remove(camera_data)
+
+
+def _new_camera_object(
+    name: str, location: tuple[float, float, float] = (0.0, 0.0, 0.0)
+) -> bpy.types.Object:
+    """Creates a camera object from `bpy.data` and links it to the active collection.
+
+    Equivalent to `bpy.ops.object.camera_add()` without the operator's selection, undo, and
+    context overhead.
+    """
+    camera_data = bpy.data.cameras.new(name)
+    camera = bpy.data.objects.new(name, camera_data)
+    bpy.context.collection.objects.link(camera)
+    camera.location = location
+    return camera
 
 
 def _setup_top_down_camera(auto_zoom: bool = True, margin: float = 2.0):
@@ -1605,11 +1908,6 @@ def _setup_top_down_camera(auto_zoom: bool = True, margin: float = 2.0):
         auto_zoom: Automatically fit camera to scene bounds
         margin: Multiplicative margin for auto-zoom (e.g., 1.5 = 50% padding)
     """
-    # Clear existing cameras
-    for obj in bpy.context.scene.objects:
-        if obj.type == "CAMERA":
-            bpy.data.objects.remove(obj, do_unlink=True)
-
     # Calculate ortho_scale
     if auto_zoom:
         bounds = calculate_scene_bounds()
@@ -1624,11 +1922,17 @@ def _setup_top_down_camera(auto_zoom: bool = True, margin: float = 2.0):
     else:
         ortho_scale = 20.0
 
-    # Add top-down orthographic camera
-    with suppress_blender_logs():
-        bpy.ops.object.camera_add(location=(0, 0, 10))  # 10 units above origin
-    camera = bpy.context.object
-    camera.name = "TopDownCamera"
+    # Reuse this scene's top-down camera from a previous render if it is still around
+    camera = _get_cached_rig_object("top_down_camera")
+    if camera is None:
+        # Clear existing cameras
+        _remove_scene_cameras()
+
+        # Add top-down orthographic camera
+        camera = _new_camera_object("TopDownCamera")
+        _cache_rig_object("top_down_camera", camera)
+
+    camera.location = (0, 0, 10)
 
     # Set to orthographic projection
     camera.data.type = "ORTHO"
@@ -1648,11 +1952,6 @@ def _setup_isometric_camera(auto_zoom: bool = True, margin: float = 2.0):
         auto_zoom: Automatically fit camera to scene bounds
         margin: Multiplicative margin for auto-zoom (e.g., 1.5 = 50% padding)
     """
-    # Clear existing cameras
-    for obj in bpy.context.scene.objects:
-        if obj.type == "CAMERA":
-            bpy.data.objects.remove(obj, do_unlink=True)
-
     # Calculate ortho_scale
     if auto_zoom:
         bounds = calculate_scene_bounds()
@@ -1673,12 +1972,17 @@ def _setup_isometric_camera(auto_zoom: bool = True, margin: float = 2.0):
     else:
         ortho_scale = 20.0
 
-    # Add isometric orthographic camera
-    with suppress_blender_logs():
-        bpy.ops.object.camera_add(location=(10, -10, 10))
-        # bpy.ops.object.camera_add(location=(5.77, -5.77, 5.77))
-    camera = bpy.context.object
-    camera.name = "IsometricCamera"
+    # Reuse this scene's isometric camera from a previous render if it is still around
+    camera = _get_cached_rig_object("isometric_camera")
+    if camera is None:
+        # Clear existing cameras
+        _remove_scene_cameras()
+
+        # Add isometric orthographic camera
+        camera = _new_camera_object("IsometricCamera")
+        _cache_rig_object("isometric_camera", camera)
+
+    camera.location = (10, -10, 10)
     camera.data.type = "ORTHO"
     camera.data.ortho_scale = ortho_scale
 
@@ -1732,9 +2036,7 @@ def _setup_egocentric_camera(
     """
 
     if not preserve_existing:
-        for obj in bpy.context.scene.objects:
-            if obj.type == "CAMERA":
-                bpy.data.objects.remove(obj, do_unlink=True)
+        _remove_scene_cameras()
 
     bounds = calculate_scene_bounds()
 
@@ -1753,11 +2055,7 @@ def _setup_egocentric_camera(
 
     camera_height = max(center_z, min_z + default_height)
 
-    with suppress_blender_logs():
-        bpy.ops.object.camera_add(location=(center_x, center_y, camera_height))
-
-    camera = bpy.context.object
-    camera.name = "EgocentricCamera"
+    camera = _new_camera_object("EgocentricCamera", location=(center_x, center_y, camera_height))
     camera.data.type = "PERSP"
     camera.data.clip_start = 0.05
     camera.data.clip_end = 500.0
@@ -1787,15 +2085,61 @@ def _setup_egocentric_camera(
 
 def _setup_lighting(energy: float = 0.2):
     """Sets up basic lighting for the scene."""
-    if not any(obj.type == "LIGHT" for obj in bpy.context.scene.objects):
-        with suppress_blender_logs():
-            bpy.ops.object.light_add(type="SUN", location=(0, 0, 15))
-        light = bpy.context.object
+    if _get_cached_rig_object("sun") is not None:
+        return
+
+    if not _scene_objects_using(bpy.data.lights):
+        light_data = bpy.data.lights.new("Sun", type="SUN")
+        light = bpy.data.objects.new("Sun", light_data)
+        bpy.context.collection.objects.link(light)
+        light.location = (0, 0, 15)
         light.data.energy = energy
         light.rotation_euler = (math.radians(15), math.radians(30), 0)  # tilt, rotation, ?
+        _cache_rig_object("sun", light)
         # logger.debug("Added top-down lighting")
 
 
+def _setup_render_view(
+    view: str,
+    format: str,
+    resolution: int,
+    show_grid: bool = False,
+    engine: str = None,
+    track_target: Optional[bpy.types.Object] = None,
+    samples: int = 256,
+):
+    """Configures engine, output image, camera, lighting, and grid for a visualization render.
+
+    Args:
+        view: The view to render from. Can be 'top_down', 'isometric', or 'egocentric'.
+        format: The format of the output image.
+        resolution: The resolution of the output image.
+        show_grid: Whether to show a grid in the visualization.
+        engine: Preferred render engine (see `_configure_render_settings()`).
+        track_target: Object the egocentric camera should track (optional).
+        samples: Render sample count (see `_configure_render_settings()`).
+    """
+    _configure_render_settings(engine=engine, samples=samples)
+    _configure_output_image(format, resolution)
+
+    if view == "top_down":
+        _setup_top_down_camera()
+    elif view == "isometric":
+        _setup_isometric_camera()
+    elif view == "egocentric":
+        _setup_egocentric_camera(track_target=track_target)
+    else:
+        raise ValueError(
+            f"Unsupported view type: {view}. Must be 'top_down', 'isometric', or 'egocentric'."
+        )
+
+    _setup_lighting(energy=0.5)
+
+    # Create grid if requested
+    if show_grid:
+        _create_grid()
+
+
 def render_to_file(output_path: str | Path) -> Path:
     """
     Renders the current scene to a file.
@@ -1830,31 +2174,54 @@ def render_to_file(output_path: str | Path) -> Path:
         raise IOError(f"Render failed - output file not created: {output_path}")
 
 
-def render_to_numpy() -> np.ndarray:
+def render_to_numpy(out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Alternative: Render directly to NumPy array in memory (no file).
 
-    NOTE: This function does not seem to work with `bpy` in "standalone" mode (directly invoked from Python).
-          To save render, it seems necessary to save the render into the filesystem, and retrieve as file.
+    NOTE: Blender's "Render Result" pixels are not accessible with `bpy` in "standalone" mode
+          (directly invoked from Python, i.e. background mode): the image stays 0x0, and the
+          compositor's "Viewer Node" image is only an empty placeholder. In that setup a render
+          can only be retrieved through a file, so use `render_to_file()` instead.
+
+    Args:
+        out: Optional C-contiguous float32 array of shape (height, width, 4) to render into, e.g.
+             to reuse one buffer across frames. A new array is allocated if omitted.
 
     Returns:
-        NumPy array of rendered image data.
+        NumPy array of rendered image data (RGBA, rows bottom-up as in Blender); `out` if given.
+
+    Raises:
+        RuntimeError: If Blender didn't keep the rendered pixels (see NOTE above).
     """
     # Render to Blender's internal buffer
     with suppress_blender_logs():
         bpy.ops.render.render(write_still=False)
 
-    # ORIG (doesn't work)
-    # Get rendered image from Blender
-    render_result = bpy.context.scene.render
-    width = render_result.resolution_x
-    height = render_result.resolution_y
+    render_result = bpy.data.images["Render Result"]
+    width, height = render_result.size
+    if width == 0 or height == 0:
+        raise RuntimeError(
+            "Render Result has no pixels (expected when `bpy` runs in background mode); "
+            "render to a file instead"
+        )
 
-    # Extract pixel data
-    pixels = bpy.data.images["Render Result"].pixels[:]
+    # Extract pixel data straight into a float32 buffer (Blender's native pixel dtype)
+    # instead of materializing a Python list of floats
+    if out is None:
+        out = np.empty((height, width, 4), dtype=np.float32)
+    elif (
+        out.shape != (height, width, 4)
+        or out.dtype != np.float32
+        or not out.flags.c_contiguous
+    ):
+        raise ValueError(
+            f"`out` must be a C-contiguous float32 array of shape {(height, width, 4)}, "
+            f"got {out.dtype} {out.shape}"
+        )
+    render_result.pixels.foreach_get(out.reshape(-1))
 
-    # Convert to NumPy array (RGBA format)
-    image_array = np.array(pixels).reshape((height, width, 4))
+    # NumPy array (RGBA format)
+    image_array = out
 
     # # ALT (doesn't work)
     # # Access pixels from the Compositor Viewer node image
@@ -1885,6 +2252,7 @@ def create_scene_visualization(
     view: str = "top_down",
     background_color: tuple[float, float, float, float] = BACKGROUND_COLOR,
     show_grid: bool = False,
+    samples: int = 256,
 ) -> Path:
     """
     Creates a visualization of the current scene.
@@ -1896,6 +2264,7 @@ def create_scene_visualization(
         view: The view to render from. Can be 'top_down', 'isometric', or 'egocentric'.
         background_color: RGBA color for the background.
         show_grid: Whether to show a grid in the visualization.
+        samples: Render sample count.
 
     Returns:
         Path to the rendered scene visualization file.
@@ -1907,7 +2276,7 @@ def create_scene_visualization(
 
     # Prepare output filepath
     if output_dir is None:
-        output_dir = tempfile.gettempdir()
+        output_dir = DEFAULT_OUTPUT_DIR
 
     output_path = get_filename(
         output_dir=output_dir,
@@ -1918,23 +2287,7 @@ def create_scene_visualization(
 
     # Suppress verbose Blender output during scene setup and rendering
     with suppress_blender_logs():
-        _configure_render_settings()
-        _configure_output_image(format, resolution)
-        if view == "top_down":
-            _setup_top_down_camera()
-        elif view == "isometric":
-            _setup_isometric_camera()
-        elif view == "egocentric":
-            _setup_egocentric_camera()
-        else:
-            raise ValueError(
-                f"Unsupported view type: {view}. Must be 'top_down', 'isometric', or 'egocentric'."
-            )
-        _setup_lighting(energy=0.5)
-
-        # Create grid if requested
-        if show_grid:
-            _create_grid()
+        _setup_render_view(view, format, resolution, show_grid=show_grid, samples=samples)
 
         scene = bpy.context.scene
         setup_lighting_foundation(scene, background_color=background_color)
@@ -1952,6 +2305,20 @@ def visualize(scene=None, **kwargs):
         return create_scene_visualization(**kwargs)
 
 
+def render_top_down(resolution: int = 512, samples: int = 32, **kwargs) -> Path:
+    """
+    A thin wrapper for a top-down `create_scene_visualization()` at preview quality.
+
+    Goes through the same `_setup_render_view()` path as the other views, so the camera, sun,
+    and engine selection are reused across calls rather than rebuilt per render. Layout previews
+    don't need full quality, hence the lower resolution and sample count defaults.
+    """
+
+    return create_scene_visualization(
+        resolution=resolution, samples=samples, view="top_down", **kwargs
+    )
+
+
 class _ObjectAugmentor:
     """Applies temporary object augmentations for visualization renders."""
 
@@ -2128,10 +2495,7 @@ def _ensure_preview_camera(scene: bpy.types.Scene) -> bpy.types.Object:
     if not camera or camera.type != "CAMERA":
         if camera and camera.type != "CAMERA":
             bpy.data.objects.remove(camera, do_unlink=True)
-        with suppress_blender_logs():
-            bpy.ops.object.camera_add(location=(0.0, 0.0, 0.0))
-        camera = bpy.context.object
-        camera.name = OBJECT_PREVIEW_CAMERA_NAME
+        camera = _new_camera_object(OBJECT_PREVIEW_CAMERA_NAME)
         # Spawn with initial rotation: +X 90 degrees (XYZ Euler)
         camera.rotation_euler = (math.radians(90.0), 0.0, 0.0)
 
@@ -2230,7 +2594,7 @@ def create_object_visualization(
         filename = "object_render"
 
     if output_dir is None:
-        output_dir = tempfile.gettempdir()
+        output_dir = DEFAULT_OUTPUT_DIR
 
     output_path = get_filename(
         output_dir=output_dir,
@@ -2249,24 +2613,14 @@ def create_object_visualization(
         )
 
         with suppress_blender_logs():
-            _configure_render_settings(engine="BLENDER_EEVEE_NEXT")
-            _configure_output_image(format, resolution)
-
-            if view == "top_down":
-                _setup_top_down_camera()
-            elif view == "isometric":
-                _setup_isometric_camera()
-            elif view == "egocentric":
-                _setup_egocentric_camera(track_target=track_target_obj)
-            else:
-                raise ValueError(
-                    f"Unsupported view type: {view}. Must be 'top_down', 'isometric', or 'egocentric'."
-                )
-
-            _setup_lighting(energy=0.5)
-
-            if show_grid:
-                _create_grid()
+            _setup_render_view(
+                view,
+                format,
+                resolution,
+                show_grid=show_grid,
+                engine="BLENDER_EEVEE_NEXT",
+                track_target=track_target_obj,
+            )
 
         scene_obj = bpy.context.scene
         highlight_targets = augmentor.prepare_highlight()
@@ -2304,8 +2658,7 @@ def load_scene_from_yaml(filepath: str) -> dict[str, Any]:
     Returns:
         A dictionary representing the scene.
     """
-    with open(filepath, "r") as f:
-        return yaml.safe_load(f)
+    return load_yaml(filepath)
 
 
 ### Lighting
@@ -2593,7 +2946,7 @@ def create_room_walls(
     # Setup debug saving
     if debug_save_steps:
         if debug_output_dir is None:
-            debug_output_dir = tempfile.gettempdir()
+            debug_output_dir = DEFAULT_OUTPUT_DIR
         debug_output_path = Path(debug_output_dir).resolve()
         debug_output_path.mkdir(parents=True, exist_ok=True)
         logger.info(f"🔍 Debug mode enabled: saving wall creation steps to {debug_output_path}")
@@ -2,20 +2,26 @@ from pathlib import Path
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 
 
 class GenericPlan(BaseModel):
     pass
 
 
-class Vector2(BaseModel):
+# NOTE: vectors are by far the most instantiated types (every boundary point and every object's
+#       position/rotation/scale), so they're slotted (frozen) pydantic dataclasses rather than
+#       `BaseModel`s; they still validate, serialize, and show up in JSON schemas the same way.
+@dataclass(slots=True, frozen=True)
+class Vector2:
     """Represents a 2D vector."""
 
     x: float
     y: float
 
 
-class Vector3(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Vector3:
     """Represents a 3D vector."""
 
     x: float
@@ -143,13 +149,21 @@ def find_shell(
     """
     Returns the shell of the requested type from a Room or room dict, or None if not found.
 
-    Accepts either a pydantic Room instance or a plain room dictionary.
+    Accepts either a pydantic Room instance or a plain room dictionary. Room dictionaries are
+    trusted (e.g., loaded from our own YAML), so only the matching shell is validated rather than
+    the whole room.
     """
-    if not isinstance(room_or_data, Room):
-        room_or_data = Room(**room_or_data)
-
-    shells = room_or_data.shells or []
-    for s in shells:
-        if s.type == shell_type:
-            return s
+    if isinstance(room_or_data, Room):
+        # NOTE: a linear scan; rooms have a handful of shells, and `shells` is mutated in place
+        for shell in room_or_data.shells or []:
+            if shell.type == shell_type:
+                return shell
+        return None
+
+    for shell in room_or_data.get("shells") or []:
+        if isinstance(shell, Shell):
+            if shell.type == shell_type:
+                return shell
+        elif shell.get("type") == shell_type:
+            return Shell(**shell)
     return None
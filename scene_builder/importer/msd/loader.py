@@ -6,26 +6,24 @@ NOTE (yunho-c): This script is hardly stateful and will probably be cleaner if i
 TODO: add rounding (safe-rounding) to boundary, to keep scene def files clean and lightweight
 """
 
-import io
+import importlib.util
+import math
 import random
-import re
+from collections import defaultdict
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional
 
-import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
 import pandas as pd
 from msd.constants import ROOM_NAMES
 from msd.graphs import extract_access_graph, get_geometries_from_id
-from msd.plot import plot_floor, set_figure
-from PIL import Image
-from rich.console import Console
-from shapely import wkt
+import shapely
 
 from scene_builder.config import MSD_CSV_PATH
 from scene_builder.definition.scene import Room, Scene, Structure, Vector2
-from scene_builder.utils.geometry import round_vector2
+from scene_builder.logging import logger
 from scene_builder.utils.room import assign_structures_to_rooms
 
 
@@ -58,33 +56,64 @@ ENTITY_SUBTYPE_MAP = {
 }
 
 
-console = Console()
+# pyarrow backs the fast CSV parser, the Parquet snapshot, and the string columns; all are
+# skipped without it
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Arrow-backed strings keep a column (notably the long WKT `geom` texts) in one contiguous buffer
+# instead of a Python object per row
+STRING_DTYPE = "string[pyarrow]" if HAS_PYARROW else "string"
+
+# Columns of the MSD CSV used by the loader (and by `msd.graphs`), with their dtypes;
+# the rest are never read. Declaring dtypes skips type inference, and the low-cardinality
+# label columns become categoricals.
+USED_DTYPES = {
+    "apartment_id": STRING_DTYPE,
+    "building_id": "Int32",
+    "floor_id": STRING_DTYPE,
+    "entity_type": "category",
+    "entity_subtype": "category",
+    "roomtype": "category",
+    "geom": STRING_DTYPE,
+}
+USED_COLS = list(USED_DTYPES)
 
 
-def parse_polygon(geom_string: str) -> list[Vector2]:
-    """Parse POLYGON string to Vector2 list"""
-    if not geom_string:
-        return []
+def _exterior_coords(geom_strings) -> tuple[np.ndarray, list[np.ndarray]]:
+    """
+    Parses WKT strings in one vectorized pass and extracts each exterior ring's coordinates.
 
-    # Extract coordinates from "POLYGON ((...))"
-    pattern = r"POLYGON\s*\(\(\s*(.*?)\s*\)\)"
-    match = re.search(pattern, geom_string)
+    Args:
+        geom_strings: WKT strings (None/NA for missing geometries)
 
-    if not match:
-        return []
+    Returns:
+        The parsed geometries (None where missing or invalid), and one (N, 2) coordinate array
+        per geometry (empty for non-polygons)
+    """
+    geom_strings = pd.Series(geom_strings, dtype=object).to_numpy(dtype=object, na_value=None)
+    geoms = shapely.from_wkt(geom_strings, on_invalid="warn")
+    rings = shapely.get_exterior_ring(geoms)  # None for anything but polygons
+    coords, ring_index = shapely.get_coordinates(rings, return_index=True)
+    ring_coords = np.split(coords, np.searchsorted(ring_index, np.arange(1, len(rings))))
+    return geoms, ring_coords
 
-    coords = []
-    try:
-        for pair in match.group(1).split(","):
-            x_str, y_str = pair.strip().split()
-            coords.append(round_vector2(Vector2(x=float(x_str), y=float(y_str)), ndigits=2))
-    except Exception as e:
-        print(f"ERROR: Failed to parse coordinates from: '{match.group(1)}' - {str(e)}")
-        return []
 
-    return coords
+def _coords_to_boundary(coords: np.ndarray, ndigits: int = 2) -> list[Vector2]:
+    """Rounds an (N, 2) coordinate array in one pass and converts it to a Vector2 list"""
+    return [Vector2(x=x, y=y) for x, y in np.round(coords, ndigits).tolist()]
 
 
+def parse_polygons(geom_strings) -> list[list[Vector2]]:
+    """Parse POLYGON strings to Vector2 lists (empty for missing/invalid/non-polygon geometries)"""
+    _, ring_coords = _exterior_coords(geom_strings)
+    return [_coords_to_boundary(coords) for coords in ring_coords]
+
+
+def parse_polygon(geom_string: str) -> list[Vector2]:
+    """Parse POLYGON string to Vector2 list"""
+    if not geom_string:
+        return []
+    return parse_polygons([geom_string])[0]
 
 
 class MSDLoader:
@@ -96,13 +125,76 @@ class MSDLoader:
     def df(self) -> pd.DataFrame:
         """load CSV data"""
         if self._df is None:
-            self._df = pd.read_csv(self.csv_path)
+            self._df = self._read_df()
         return self._df
 
+    @property
+    def cache_path(self) -> Path:
+        """Parquet snapshot of the used CSV columns, next to the CSV"""
+        return self.csv_path.with_suffix(".parquet")
+
+    def _read_df(self) -> pd.DataFrame:
+        """Read the Parquet snapshot if it is up to date; otherwise parse the CSV and write it."""
+        if not HAS_PYARROW:
+            return pd.read_csv(self.csv_path, usecols=USED_COLS, dtype=USED_DTYPES)
+
+        cache_path = self.cache_path
+        if self._has_fresh_cache():
+            # NOTE: no-op for snapshots written with `USED_DTYPES`
+            return pd.read_parquet(cache_path, columns=USED_COLS).astype(USED_DTYPES)
+
+        df = pd.read_csv(self.csv_path, engine="pyarrow", usecols=USED_COLS, dtype=USED_DTYPES)
+        try:
+            df.to_parquet(cache_path, compression="zstd")
+        except OSError as e:  # e.g., read-only data directory; keep working from the CSV
+            logger.warning(f"Failed to write Parquet snapshot '{cache_path}': {e}")
+        return df
+
+    def _has_fresh_cache(self) -> bool:
+        """Whether the Parquet snapshot exists and is not older than the CSV"""
+        cache_path = self.cache_path
+        return (
+            HAS_PYARROW
+            and cache_path.exists()
+            and cache_path.stat().st_mtime >= self.csv_path.stat().st_mtime
+        )
+
+    def _load_building(self, building_id: int) -> pd.DataFrame:
+        """
+        Rows of a single building.
+
+        Slices `df` if it is already loaded; otherwise only the building's row groups are read from
+        the Parquet snapshot (predicate pushdown), without materializing the full table.
+        """
+        if self._df is None and self._has_fresh_cache():
+            return pd.read_parquet(
+                self.cache_path,
+                columns=USED_COLS,
+                filters=[("building_id", "==", int(building_id))],
+            ).astype(USED_DTYPES)
+
+        rows = self._rows_by_building.get(building_id, np.empty(0, dtype=np.intp))
+        return self.df.iloc[rows]
+
+    @cached_property
+    def _rows_by_apartment(self) -> dict[str, np.ndarray]:
+        """Row positions in `df` of each apartment (built once, instead of a scan per lookup)"""
+        return self.df.groupby("apartment_id", sort=False, observed=True).indices
+
+    @cached_property
+    def _rows_by_building(self) -> dict[int, np.ndarray]:
+        """Row positions in `df` of each building"""
+        return self.df.groupby("building_id", sort=False, observed=True).indices
+
+    @cached_property
+    def _room_counts(self) -> pd.Series:
+        """Number of rooms (`area` entities) per apartment"""
+        return self.df[self.df["entity_type"] == "area"].groupby("apartment_id").size()
+
     def get_apartment_list(self, min_rooms: int = 5, max_rooms: int = 30) -> list[str]:
         """Get list of apartment IDs"""
         # Count actual rooms per apartment
-        room_counts = self.df[self.df["entity_type"] == "area"].groupby("apartment_id").size()
+        room_counts = self._room_counts
 
         # Filter by room count
         suitable = room_counts[(room_counts >= min_rooms) & (room_counts <= max_rooms)].index.tolist()  # fmt:skip
@@ -117,7 +209,7 @@ class MSDLoader:
         self, building_id: int, floor_id: Optional[str] = None
     ) -> List[str]:
         """Get list of apartment IDs in a building, optionally filtered by floor_id"""
-        building_data = self.df[self.df["building_id"] == building_id]
+        building_data = self._load_building(building_id)
 
         if floor_id is not None:
             building_data = building_data[building_data["floor_id"] == floor_id]
@@ -126,14 +218,40 @@ class MSDLoader:
         apartments = building_data["apartment_id"].dropna().unique().tolist()
         return apartments
 
+    def get_apartment_floors(
+        self, building_id: int, floor_id: Optional[str] = None
+    ) -> dict[str, List[str]]:
+        """
+        Group the apartments of a building by floor, without building their graphs.
+
+        Each apartment is listed under the floor `create_graph()` uses for it (its first floor).
+        With `floor_id`, only apartments with entities on that floor are included, as in
+        `get_apartments_in_building()`.
+        """
+        building_data = self._load_building(building_id)
+        first_rows = building_data.dropna(subset=["apartment_id"]).drop_duplicates("apartment_id")
+
+        if floor_id is not None:
+            on_floor = building_data.loc[building_data["floor_id"] == floor_id, "apartment_id"]
+            first_rows = first_rows[first_rows["apartment_id"].isin(on_floor.dropna())]
+
+        floors = defaultdict(list)
+        for apartment_id, apt_floor_id in zip(
+            first_rows["apartment_id"].tolist(), first_rows["floor_id"].tolist()
+        ):
+            floors[apt_floor_id].append(apartment_id)
+        return dict(floors)
+
     def create_graph(self, apartment_id: str, format="msd") -> Optional[nx.Graph]:
         """Create NetworkX graph for one apartment - includes all entity types"""
-        apt_data = self.df[self.df["apartment_id"] == apartment_id]
+        rows = self._rows_by_apartment.get(apartment_id)
 
-        if len(apt_data) == 0:
+        if rows is None:
             print(f"No data found for apartment {apartment_id}")
             return None
 
+        apt_data = self.df.iloc[rows]
+
         # Use first floor first
         floor_id = apt_data["floor_id"].iloc[0]
 
@@ -149,27 +267,30 @@ class MSDLoader:
             graph.graph["ID"] = floor_id
             graph.graph["floor_id"] = floor_id
 
-            for idx, row in floor_data.iterrows():
-                geom_str = row.get("geom")
-                coords = []
-                centroid = (0, 0)
-
-                if pd.notna(geom_str):
-                    try:
-                        geom = wkt.loads(geom_str)
-                        if hasattr(geom, "exterior"):
-                            coords = list(geom.exterior.coords)
-                        if hasattr(geom, "centroid"):
-                            centroid = (geom.centroid.x, geom.centroid.y)
-                    except Exception:
-                        pass
-
-                    graph.add_node(
-                        idx,
-                        entity_subtype=row.get("entity_subtype"),
-                        geometry=coords,
-                        centroid=centroid,
-                    )
+            # Parse all geometries of the floor at once
+            geoms, ring_coords = _exterior_coords(floor_data["geom"])
+            centroids = shapely.centroid(geoms)
+            centroid_xs = shapely.get_x(centroids).tolist()  # NaN for missing/empty geometries
+            centroid_ys = shapely.get_y(centroids).tolist()
+            has_geom = floor_data["geom"].notna().tolist()
+            entity_subtypes = floor_data["entity_subtype"].tolist()
+
+            # Only assemble the nodes per row (no per-row `Series` as with `iterrows()`)
+            for idx in range(len(floor_data)):
+                if not has_geom[idx]:
+                    continue
+
+                coords = [tuple(p) for p in ring_coords[idx].tolist()]
+                centroid = (centroid_xs[idx], centroid_ys[idx])
+                if math.isnan(centroid[0]):
+                    centroid = (0, 0)
+
+                graph.add_node(
+                    idx,
+                    entity_subtype=entity_subtypes[idx],
+                    geometry=coords,
+                    centroid=centroid,
+                )
 
         # Add metadata
         graph.graph["apartment_id"] = apartment_id
@@ -212,35 +333,33 @@ class MSDLoader:
             if "geometry" not in attrs:
                 continue
 
+            # Skip unmapped subtypes before converting their coordinates
+            category = ENTITY_SUBTYPE_MAP.get(attrs.get("entity_subtype"))
+            if category is None:
+                continue
+
             # Parse geometry
             geometry_data = attrs["geometry"]
             if isinstance(geometry_data, list) and len(geometry_data) > 0:
                 # Already parsed coordinates
-                coords = [
-                    round_vector2(Vector2(x=float(p[0]), y=float(p[1])), ndigits=2)
-                    for p in geometry_data
-                ]
+                coords = _coords_to_boundary(np.asarray(geometry_data, dtype=np.float64)[:, :2])
             else:
                 coords = []
 
             if not coords:
                 continue
 
-            entity_subtype = attrs.get("entity_subtype")
-            category = ENTITY_SUBTYPE_MAP.get(entity_subtype)
-
-            if category is None:
-                continue
-
             uid = f"msd_{apt_prefix}_{node_id}"  # NOTE: ensures unique id; future-proof
 
+            # NOTE: `model_construct` skips validation; all fields here are built above with the
+            #       right types (str ids/categories, `Vector2` boundaries)
             # Detect structural elements
             if category in ("window", "door") and coords:
-                structures.append(Structure(id=uid, type=category, boundary=coords))
+                structures.append(Structure.model_construct(id=uid, type=category, boundary=coords))
 
             else:
                 # Regular room
-                room = Room(
+                room = Room.model_construct(
                     id=uid,
                     category=category,
                     tags=["msd"],
@@ -288,9 +407,9 @@ class MSDLoader:
         )
 
     # NOTE: Only used in `test_floor_plan_postprocessing.py`; TODO: refactor out.
-    def get_scene(self, apartment_id: str) -> Optional[Scene]:
+    def get_scene(self, apartment_id: str, format="msd") -> Optional[Scene]:
         """Create graph and convert to a Scene in one step."""
-        graph = self.create_graph(apartment_id)
+        graph = self.create_graph(apartment_id, format=format)
         if graph is None:
             return None
         return self.apt_graph_to_scene(graph)
@@ -303,6 +422,7 @@ class MSDLoader:
         edge_size: int = 3,
         show: bool = False,
         show_label=False,
+        compress_level: int = 3,
     ) -> np.ndarray | str | None:
         """
         Render a floor plan graph to an image file or numpy array.
@@ -314,6 +434,7 @@ class MSDLoader:
             edge_size: Width of connection edges (default: 3)
             show: If True, display the plot interactively (default: False)
             show_label: If True, shows room label
+            compress_level: zlib level (0-9) for saved PNGs; lower is faster but larger (default: 3)
 
         Returns:
             - If output_path is provided: Path to the saved image file
@@ -328,6 +449,11 @@ class MSDLoader:
             >>> # Get as numpy array
             >>> img_array = loader.render_floor_plan(graph)
         """
+        # NOTE: imported lazily; slow to import and only used for rendering
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from msd.plot import plot_floor, set_figure
+
         # Create figure
         fig, ax = set_figure(nc=1, nr=1)
 
@@ -343,21 +469,31 @@ class MSDLoader:
             plt.close(fig)
             return None
         elif output_path is None:
-            # Return as numpy array
-            buf = io.BytesIO()
-            plt.savefig(buf, format="png", bbox_inches="tight", dpi=150)
-            buf.seek(0)
-
-            # Convert to numpy array
-            img = Image.open(buf)
-            img_array = np.array(img)
-
-            buf.close()
+            # Return as numpy array, read straight from the Agg buffer (no PNG encode/decode)
+            fig.set_dpi(150)
+            canvas = FigureCanvasAgg(fig)
+            canvas.draw()
+            rgba = np.asarray(canvas.buffer_rgba())
+
+            # Crop like `bbox_inches="tight"` (incl. its default 0.1" padding)
+            bbox = fig.get_tightbbox(canvas.get_renderer()).padded(0.1)
+            bbox = bbox.transformed(fig.dpi_scale_trans)
+            height = rgba.shape[0]
+            x0, y0 = max(round(bbox.x0), 0), max(round(height - bbox.y1), 0)
+            x1, y1 = x0 + int(bbox.width), y0 + int(bbox.height)
+
+            # NOTE: copy, as the buffer is freed along with the figure
+            img_array = rgba[y0:y1, x0:x1].copy()
             plt.close(fig)
             return img_array
         else:
             # Save to file
-            plt.savefig(output_path, bbox_inches="tight", dpi=150)
+            plt.savefig(
+                output_path,
+                bbox_inches="tight",
+                dpi=150,
+                pil_kwargs={"compress_level": compress_level},
+            )
             plt.close(fig)
             return output_path
 
@@ -1,11 +1,26 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 import objaverse
 
 from scene_builder.config import GDB_API_BASE_URL
 from scene_builder.logging import logger
 
+# Object uid -> resolved GLB path (skips the HTTP lookup / download for repeated imports)
+_object_paths: dict[str, str] = {}
+
+
+def _cached_object_path(object_uid: str) -> Optional[str]:
+    """Returns the previously resolved path of an object, if it still exists on disk."""
+    path = _object_paths.get(object_uid)
+    if path is not None and not Path(path).exists():
+        _object_paths.pop(object_uid, None)
+        return None
+    return path
+
+
 def import_object(object_uid: str, source="cache") -> str:
     """
     Imports a 3D object from the Objaverse dataset and returns the path to the downloaded file.
@@ -16,6 +31,10 @@ def import_object(object_uid: str, source="cache") -> str:
     Returns:
         The path to the downloaded 3D model file, or None if download fails.
     """
+    cached_path = _cached_object_path(object_uid)
+    if cached_path is not None:
+        return cached_path
+
     print(f"Importing objaverse object: {object_uid}")
 
     if source == "cache":
@@ -25,17 +44,73 @@ def import_object(object_uid: str, source="cache") -> str:
         path = response.json()["path"]
         assert Path(path).exists()
         # logger.debug(f"[importer/objaverse]: located asset at {path}")
+        _object_paths[object_uid] = path
         return path
 
     elif source == "objaverse":
-        print(f"Downloading object {object_uid} from Objaverse...")
-        downloaded_objects: dict[str, str] = objaverse.load_objects(
-            uids=[object_uid], download_processes=1
-        )
-
-        # The path from the download
-        original_path = downloaded_objects.get(object_uid)
-        return original_path
+        return import_objects([object_uid], source="objaverse").get(object_uid)
     else:
         print(f"Failed to download object: {object_uid}")
         return None
+
+
+def _try_import_object(object_uid: str, source: str) -> Optional[str]:
+    """Runs `import_object()`, returning None instead of raising."""
+    try:
+        return import_object(object_uid, source=source)
+    except Exception as e:
+        logger.debug(f"Failed to import objaverse object {object_uid}: {e}")
+        return None
+
+
+def import_objects(
+    object_uids: list[str], source="cache", max_processes: int = 8, max_workers: int = 16
+) -> dict[str, str]:
+    """
+    Imports several 3D objects from the Objaverse dataset at once.
+
+    Objects that were imported before are returned without any lookup. For `source="objaverse"`,
+    the remaining objects are downloaded in a single `objaverse.load_objects()` call, spread over
+    up to `max_processes` download processes (instead of one serial download per object). Other
+    sources are looked up concurrently on up to `max_workers` threads (the lookups are I/O-bound).
+
+    Args:
+        object_uids: The unique identifiers of the objects to import.
+        source: Where to import from ("cache" or "objaverse"), see `import_object()`.
+        max_processes: Maximum number of parallel download processes (objaverse only).
+        max_workers: Maximum number of concurrent lookups (other sources).
+
+    Returns:
+        Mapping of object uid -> path to the downloaded 3D model file, for the objects that could
+        be imported.
+    """
+    paths = {}
+    missing = []
+    for object_uid in dict.fromkeys(object_uids):
+        cached_path = _cached_object_path(object_uid)
+        if cached_path is not None:
+            paths[object_uid] = cached_path
+        else:
+            missing.append(object_uid)
+
+    if not missing:
+        return paths
+
+    if source == "objaverse":
+        print(f"Downloading {len(missing)} object(s) from Objaverse...")
+        # NOTE: `load_objects()` keeps its own on-disk cache and skips already downloaded files
+        downloaded_objects: dict[str, str] = objaverse.load_objects(
+            uids=missing, download_processes=min(len(missing), max_processes)
+        )
+        for object_uid, path in downloaded_objects.items():
+            if path:
+                _object_paths[object_uid] = path
+                paths[object_uid] = path
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(missing), max_workers)) as executor:
+            found = executor.map(_try_import_object, missing, [source] * len(missing))
+            for object_uid, path in zip(missing, found):
+                if path:
+                    paths[object_uid] = path
+
+    return paths
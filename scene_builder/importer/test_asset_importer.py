@@ -1,8 +1,7 @@
 import os
-from pathlib import Path
 import random
 import tempfile
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from scene_builder.config import TEST_ASSET_DIR
 from scene_builder.definition.scene import ObjectBlueprint
@@ -65,6 +64,20 @@ TEST_ASSETS: Dict[str, List[Dict[str, Any]]] = {
     ],
 }
 
+# `TEST_ASSETS` as blueprints, built once at import (validated once, not per search)
+_BLUEPRINTS: Dict[str, Tuple[ObjectBlueprint, ...]] = {
+    category: tuple(
+        ObjectBlueprint(
+            source_id=object["source_id"],
+            name=object["name"],
+            description=object["description"],
+            source=object["source"],
+        )
+        for object in objects
+    )
+    for category, objects in TEST_ASSETS.items()
+}
+
 
 def search_test_asset(object_category: str) -> ObjectBlueprint:
     """
@@ -76,17 +89,10 @@ def search_test_asset(object_category: str) -> ObjectBlueprint:
     Returns:
         The path to the dummy 3D model file.
     """
-    relevant_objects = TEST_ASSETS[object_category]
-    random_index = random.randint(0, len(relevant_objects) - 1)
-    object = relevant_objects[random_index]
-
-    return ObjectBlueprint(
-        source_id=object["source_id"],
-        name=object["name"],
-        description=object["description"],
-        source=object["source"],
-    )
+    # NOTE: a (shallow) copy, so callers can't modify the shared blueprint
+    return random.choice(_BLUEPRINTS[object_category]).model_copy()
 
 
 def import_test_asset(id: str) -> str:
-    return str(Path(f"{TEST_ASSET_DIR}/objects/{id}.glb"))
+    # NOTE: `os.path.join` instead of `Path`, as this runs for every test asset placed in a scene
+    return os.path.join(TEST_ASSET_DIR, "objects", f"{id}.glb")
@@ -164,28 +164,57 @@ def enable_window_it_addon() -> bool:
         return False
 
 
-def configure_gpu_backend(backend="OPTIX"):
+# Cycles compute backends to try, in order of preference
+GPU_BACKEND_PREFERENCE = ("OPTIX", "CUDA", "HIP", "METAL", "ONEAPI")
+
+# Backend set up by `configure_gpu_backend()` (preferences persist for the session)
+_configured_gpu_backend: str | None = None
+_gpu_backend_probed = False
+
+
+def configure_gpu_backend(backend: str | None = None) -> str | None:
     """
     Configures Blender's system preferences to use a specific GPU backend.
 
     This function enables the specified backend (e.g., 'OPTIX', 'HIP', 'CUDA')
     and activates all corresponding GPU devices, while disabling the CPU.
+    The device setup only runs once per session; later calls return the configured backend.
 
     Args:
         backend (str): The Cycles compute device type to use.
-                       One of: 'OPTIX', 'HIP', 'CUDA', 'METAL', 'NONE'.
-                       Defaults to 'OPTIX'.
+                       One of: 'OPTIX', 'HIP', 'CUDA', 'METAL', 'ONEAPI', 'NONE'.
+                       Defaults to the first available one in `GPU_BACKEND_PREFERENCE`.
+
+    Returns:
+        The configured backend, or None if no GPU backend is available.
     """
-    logger.info(f"Configuring System Preferences for {backend}")
+    global _configured_gpu_backend, _gpu_backend_probed
+
+    if _gpu_backend_probed and backend in (None, _configured_gpu_backend):
+        return _configured_gpu_backend
+    _gpu_backend_probed = True
+    _configured_gpu_backend = None
 
     # Get Cycles preferences
     prefs = bpy.context.preferences.addons["cycles"].preferences
 
-    # Set the compute device type
-    prefs.compute_device_type = backend
+    # Set the compute device type (unsupported ones are rejected with a TypeError)
+    for candidate in (backend,) if backend else GPU_BACKEND_PREFERENCE:
+        try:
+            prefs.compute_device_type = candidate
+        except TypeError:
+            continue
+        # Force a device list update
+        prefs.get_devices()
+        if any(device.type == candidate for device in prefs.devices):
+            backend = candidate
+            break
+    else:
+        logger.info("No GPU compute backend available, rendering on CPU")
+        prefs.compute_device_type = "NONE"
+        return None
 
-    # Force a device list update
-    prefs.get_devices()
+    logger.info(f"Configuring System Preferences for {backend}")
 
     # Loop over devices and enable GPUs, disable CPU
     enabled_gpus = 0
@@ -201,6 +230,8 @@ def configure_gpu_backend(backend="OPTIX"):
                 logger.info(f"Disabling CPU: {device.name}")
 
     logger.info(f"Successfully enabled {enabled_gpus} {backend} device(s).")
+    _configured_gpu_backend = backend
+    return backend
 
 
 def optimize_scene_for_gpu(scene=None, noise_threshold=0.05, max_bounces=8):
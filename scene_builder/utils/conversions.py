@@ -1,15 +1,25 @@
+import dataclasses
 from pathlib import Path
 from typing import Type, TypeVar
 
 import yaml
 from pydantic import BaseModel
 
+try:
+    # libyaml-backed loader; several times faster on large scene files
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlSafeLoader
+
 T = TypeVar("T", bound=BaseModel)
 
 
 def pydantic_to_dict(obj):
     if isinstance(obj, BaseModel):
         return obj.model_dump()
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # e.g. `Vector2`/`Vector3` (pydantic dataclasses)
+        return dataclasses.asdict(obj)
     elif isinstance(obj, list):
         return [pydantic_to_dict(i) for i in obj]
     elif isinstance(obj, dict):
@@ -18,6 +28,20 @@ def pydantic_to_dict(obj):
         return obj
 
 
+def load_yaml(file_path: Path | str):
+    """
+    Loads a YAML file with the safe loader, using the C implementation when available.
+
+    Args:
+        file_path: The path to the YAML file.
+
+    Returns:
+        The parsed YAML document.
+    """
+    with open(file_path, "r") as f:
+        return yaml.load(f, Loader=YamlSafeLoader)
+
+
 def pydantic_from_yaml(file_path: Path | str, model_class: Type[T]) -> T:
     """
     Loads a Pydantic model from a YAML file.
@@ -29,6 +53,5 @@ def pydantic_from_yaml(file_path: Path | str, model_class: Type[T]) -> T:
     Returns:
         An instance of the Pydantic model.
     """
-    with open(file_path, "r") as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(file_path)
     return model_class(**data)
@@ -1,5 +1,11 @@
 from pathlib import Path
 
+# Maximum number of files per (output_dir, base_name, extension) for the "increment" strategy
+MAX_INCREMENT = 1000
+
+# Next index to try per (output_dir, base_name, extension) for the "increment" strategy
+_next_increment: dict[tuple[str, str, str], int] = {}
+
 
 def get_filename(
     output_dir: Path | str, base_name: str, extension: str, strategy="increment"
@@ -18,7 +24,7 @@ def get_filename(
         A unique file path as a string.
 
     Raises:
-        FileExistsError: If a unique filename cannot be found after 1000 attempts.
+        FileExistsError: If all `MAX_INCREMENT` filenames are taken.
         NotImplementedError: If an unsupported strategy is provided.
     """
     output_dir = Path(output_dir)
@@ -26,13 +32,19 @@ def get_filename(
         output_dir.mkdir(parents=True, exist_ok=True)
 
     if strategy == "increment":
-        for i in range(1000):
+        # Resume after the last index handed out instead of re-probing from 0 on every call,
+        # wrapping around to reuse indices whose files were never written (or were removed)
+        key = (str(output_dir), base_name, extension)
+        start = _next_increment.get(key, 0)
+        for offset in range(MAX_INCREMENT):
+            i = (start + offset) % MAX_INCREMENT
             candidate = output_dir / f"{base_name}_{i}.{extension}"
             if not candidate.exists():
+                _next_increment[key] = (i + 1) % MAX_INCREMENT
                 return str(candidate)
 
         raise FileExistsError(
-            f"Could not find a unique filename for '{base_name}' after 1000 attempts."
+            f"Could not find a unique filename for '{base_name}' after {MAX_INCREMENT} attempts."
         )
     else:
         raise NotImplementedError(f"Strategy '{strategy}' is not implemented.")
@@ -4,14 +4,13 @@ from __future__ import annotations
 
 import math
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import bpy
-import matplotlib.pyplot as plt
 import numpy as np
 from mathutils import Vector
-from PIL import Image
-from shapely import affinity
+import shapely
+from shapely import STRtree
 from shapely.geometry import Point, Polygon, LineString
 
 
@@ -19,10 +18,34 @@ from scene_builder.definition.scene import Room, Vector2
 from scene_builder.utils.geometry import are_boundaries_close
 
 
+def _as_geometry_array(polygons: list[Optional[Polygon]]) -> np.ndarray:
+    """Packs polygons (or None) into a 1D object array for the vectorized shapely functions."""
+    geoms = np.empty(len(polygons), dtype=object)
+    geoms[:] = polygons
+    return geoms
+
+
+def _valid_polygon_mask(polygons: list[Optional[Polygon]] | np.ndarray) -> np.ndarray:
+    """Vectorized `p is not None and p.is_valid and not p.is_empty` (False for None)."""
+    geoms = polygons if isinstance(polygons, np.ndarray) else _as_geometry_array(polygons)
+    return shapely.is_valid(geoms) & ~shapely.is_empty(geoms)
+
+
+def _valid_polygons(polygons: list[Optional[Polygon]]) -> list[Polygon]:
+    """Filters out missing, invalid and empty polygons (validated in bulk)."""
+    return [p for p, valid in zip(polygons, _valid_polygon_mask(polygons).tolist()) if valid]
+
+
+def _build_entity_tree(entity_polygons: list[Polygon]) -> STRtree:
+    """Builds an STRtree over the valid, non-empty entity polygons, for `classify_door_type`."""
+    return STRtree(_valid_polygons(entity_polygons))
+
+
 def classify_door_type(
     door_polygon: Polygon,
     all_entity_polygons: list[Polygon],
     proximity_threshold: float = 0.01,
+    entity_tree: Optional[STRtree] = None,
 ) -> str:
     """
     Classify a door as interior or exterior based on proximity to other entities.
@@ -34,6 +57,8 @@ def classify_door_type(
         door_polygon: The door boundary as a shapely Polygon
         all_entity_polygons: List of all other entity polygons (excluding doors)
         proximity_threshold: Distance threshold in meters (default: 0.01m = 1cm)
+        entity_tree: `_build_entity_tree(all_entity_polygons)`, to reuse one spatial index when
+                     classifying many doors against the same entities (optional)
 
     Returns:
         "interior" if more than 1 entity is within threshold distance
@@ -45,19 +70,12 @@ def classify_door_type(
     if not all_entity_polygons:
         return "exterior"
 
-    # Count entities within proximity threshold
-    nearby_count = 0
-    for entity_polygon in all_entity_polygons:
-        if not entity_polygon or entity_polygon.is_empty or not entity_polygon.is_valid:
-            continue
+    if entity_tree is None:
+        entity_tree = _build_entity_tree(all_entity_polygons)
 
-        try:
-            distance = door_polygon.distance(entity_polygon)
-            if distance <= proximity_threshold:
-                nearby_count += 1
-        except Exception:
-            # Skip if distance calculation fails
-            continue
+    # Count entities within proximity threshold (the tree prunes far-away entities)
+    nearby = entity_tree.query(door_polygon, predicate="dwithin", distance=proximity_threshold)
+    nearby_count = len(nearby)
 
     # Classify: more than 1 nearby entity = interior, otherwise exterior
     if nearby_count > 1:
@@ -65,6 +83,36 @@ def classify_door_type(
     else:
         return "exterior"
 
+
+def classify_door_types(
+    door_polygons: list[Polygon],
+    all_entity_polygons: list[Polygon],
+    proximity_threshold: float = 0.01,
+) -> list[str]:
+    """
+    Batched `classify_door_type()`: classifies all doors against the same entities in one query.
+
+    Args:
+        door_polygons: The door boundaries as shapely Polygons
+        all_entity_polygons: List of all other entity polygons (excluding doors)
+        proximity_threshold: Distance threshold in meters (default: 0.01m = 1cm)
+
+    Returns:
+        "interior" or "exterior" for each door, in order (see `classify_door_type()`)
+    """
+    if not door_polygons:
+        return []
+
+    # Invalid/empty doors are classified as exterior; the tree skips `None` geometries
+    doors = _as_geometry_array(door_polygons)
+    doors[~_valid_polygon_mask(doors)] = None
+    door_indices, _ = _build_entity_tree(all_entity_polygons).query(
+        doors, predicate="dwithin", distance=proximity_threshold
+    )
+    nearby_counts = np.bincount(door_indices, minlength=len(doors))
+    return np.where(nearby_counts > 1, "interior", "exterior").tolist()
+
+
 def _project_point_onto_line_segment(point, line_start, line_end):
     """Project a point onto a line segment and return the projection point and parameter t.
     
@@ -175,7 +223,20 @@ def _find_room_edges_touching_interior_doors(rooms: list[Room], threshold: float
     Returns:
         Dictionary mapping (room_idx, edge_idx) to list of touching door segments [(start, end), ...]
     """
-    interior_doors = []
+    # Room polygons to classify doors against; same for every door
+    room_polygons = []
+    for r in rooms:
+        r_boundary = r.get("boundary") if isinstance(r, dict) else getattr(r, "boundary", None)
+        if r_boundary and len(r_boundary) >= 3:
+            try:
+                rb = [Vector2(x=v["x"], y=v["y"]) if isinstance(v, dict) else v for v in r_boundary]
+                room_polygons.append(Polygon(_boundary_to_xy(rb)))
+            except Exception:
+                continue
+    room_polygons = _valid_polygons(room_polygons)
+
+    door_boundaries = []
+    door_polygons = []
     for room in rooms:
         r_structure = room.get("structure") if isinstance(room, dict) else getattr(room, "structure", None)
         if r_structure:
@@ -191,27 +252,21 @@ def _find_room_edges_touching_interior_doors(rooms: list[Room], threshold: float
                             door_boundary.append(v)
                     
                     try:
-                        boundary_xy = [(v.x, v.y) for v in door_boundary]
-                        door_polygon = Polygon(boundary_xy)
-                        if door_polygon.is_valid and not door_polygon.is_empty:
-                            room_polygons = []
-                            for r in rooms:
-                                r_boundary = r.get("boundary") if isinstance(r, dict) else getattr(r, "boundary", None)
-                                if r_boundary and len(r_boundary) >= 3:
-                                    try:
-                                        rb = [Vector2(x=v["x"], y=v["y"]) if isinstance(v, dict) else v for v in r_boundary]
-                                        rb_xy = [(v.x, v.y) for v in rb]
-                                        room_poly = Polygon(rb_xy)
-                                        if room_poly.is_valid and not room_poly.is_empty:
-                                            room_polygons.append(room_poly)
-                                    except Exception:
-                                        continue
-                            
-                            door_type = classify_door_type(door_polygon, room_polygons)
-                            if door_type == "interior":
-                                interior_doors.append(door_boundary)
+                        door_polygons.append(Polygon(_boundary_to_xy(door_boundary)))
+                        door_boundaries.append(door_boundary)
                     except Exception:
                         continue
+
+    # Drop invalid/empty doors (validated in bulk), then classify all doors at once
+    door_valid = _valid_polygon_mask(door_polygons).tolist()
+    door_boundaries = [b for b, valid in zip(door_boundaries, door_valid) if valid]
+    door_polygons = [p for p, valid in zip(door_polygons, door_valid) if valid]
+    door_types = classify_door_types(door_polygons, room_polygons)
+    interior_doors = [
+        door_boundary
+        for door_boundary, door_type in zip(door_boundaries, door_types)
+        if door_type == "interior"
+    ]
     
     if not interior_doors:
         return {}
@@ -354,7 +409,9 @@ def plot_floor_plan(
     show_windows: bool = False,
     show_adjacent_walls: bool = False,
     show_door_touching_edges: bool = True,
-    adjacency_threshold: float = 0.05
+    adjacency_threshold: float = 0.05,
+    compress_level: int = 3,
+    ax=None,
 ):
     """Plot floor plan showing room boundaries with adjacent wall segments in green.
 
@@ -368,8 +425,20 @@ def plot_floor_plan(
         show_adjacent_walls: If True, show adjacent wall segments in green
         show_door_touching_edges: If True, show room edges touching interior doors in magenta
         adjacency_threshold: Distance threshold for considering walls adjacent (default: 0.05m)
+        compress_level: zlib level (0-9) for the saved PNG; lower is faster but larger (default: 3)
+        ax: Matplotlib axes to draw into (cleared first), e.g. to reuse one figure across many
+            floors. The caller then owns (and closes) its figure. If None, a new figure is created.
     """
-    fig, ax = plt.subplots(figsize=(12, 12))
+    # NOTE: imported lazily; slow to import and only used for plots
+    from matplotlib.figure import Figure
+
+    if ax is None:
+        # NOTE: not created through pyplot, so not kept alive by its figure registry (no close)
+        fig = Figure(figsize=(12, 12))
+        ax = fig.add_subplot()
+    else:
+        fig = ax.figure
+        ax.clear()
 
     # Find adjacent wall segments if enabled
     adjacent_segments = []
@@ -409,9 +478,8 @@ def plot_floor_plan(
                                'm-', linewidth=1, zorder=11)
             
             # Fill the room
-            x = [v.x for v in room.boundary] + [room.boundary[0].x]
-            y = [v.y for v in room.boundary] + [room.boundary[0].y]
-            ax.fill(x, y, color="lightblue", alpha=0.3)
+            ring = _closed_ring_xy(room.boundary)
+            ax.fill(ring[:, 0], ring[:, 1], color="lightblue", alpha=0.3)
 
     # Plot interior doors and windows if enabled
     if show_doors or show_windows:
@@ -421,28 +489,29 @@ def plot_floor_plan(
             for room in rooms:
                 if room.boundary and len(room.boundary) >= 3:
                     try:
-                        boundary_xy = [(v.x, v.y) for v in room.boundary]
-                        room_polygon = Polygon(boundary_xy)
-                        if room_polygon.is_valid and not room_polygon.is_empty:
-                            all_room_polygons.append(room_polygon)
+                        all_room_polygons.append(Polygon(_boundary_to_xy(room.boundary)))
                     except Exception:
                         continue
+            all_room_polygons = _valid_polygons(all_room_polygons)
+        room_tree = _build_entity_tree(all_room_polygons)
 
         # Plot interior doors and windows
         for room in rooms:
             if room.structure:
                 for struct in room.structure:
                     if struct.boundary and len(struct.boundary) >= 3:
-                        x = [v.x for v in struct.boundary] + [struct.boundary[0].x]
-                        y = [v.y for v in struct.boundary] + [struct.boundary[0].y]
+                        # Coordinates are extracted once and shared by the polygon and the plots
+                        ring = _closed_ring_xy(struct.boundary)
+                        x, y = ring[:, 0], ring[:, 1]
                         
                         # Only plot interior doors (same color as room boundaries) if enabled
                         if show_doors and struct.type == "door":
                             try:
-                                boundary_xy = [(v.x, v.y) for v in struct.boundary]
-                                door_polygon = Polygon(boundary_xy)
+                                door_polygon = Polygon(ring)
                                 if door_polygon.is_valid and not door_polygon.is_empty:
-                                    door_type = classify_door_type(door_polygon, all_room_polygons)
+                                    door_type = classify_door_type(
+                                        door_polygon, all_room_polygons, entity_tree=room_tree
+                                    )
                                     if door_type == "interior":
                                         ax.plot(x, y, color='blue', linewidth=1)
                                         ax.fill(x, y, color='lightblue', alpha=0.3)
@@ -454,8 +523,7 @@ def plot_floor_plan(
                             ax.fill(x, y, color='yellow', alpha=0.7)
     
     ax.set_aspect('equal')
-    plt.savefig(output_path, dpi=150)
-    plt.close()
+    fig.savefig(output_path, dpi=150, pil_kwargs={"compress_level": compress_level})
     print(f"Saved floor plan to {output_path}")
 
 
@@ -546,20 +614,20 @@ def scale_boundary_for_cutout(
         rotation_angle = get_dominant_angle([boundary_poly], strategy="complex_sum")
         centroid = boundary_poly.centroid
         centroid_coords = (centroid.x, centroid.y)
+        boundary_centroid = np.array(centroid_coords)
 
-        aligned_poly = affinity.rotate(
-            boundary_poly, rotation_angle, origin=centroid_coords, use_radians=False
-        )
-        minx, miny, maxx, maxy = aligned_poly.bounds
-        width = maxx - minx
-        height = maxy - miny
+        # Align to the dominant direction (only needed for the extents, so only on the coordinates)
+        align = _rotation_matrix(rotation_angle)
+        aligned_coords = (shapely.get_coordinates(boundary_poly) - boundary_centroid) @ align.T
+        width, height = np.ptp(aligned_coords, axis=0).tolist()
         is_width_dominant = width >= height
 
         scaled_poly = boundary_poly
         scale_axis_vector = np.array([0.0, 0.0])
         arrow_points = None
-        boundary_centroid = np.array(centroid_coords)
 
+        # Rotate → scale → rotate back is folded into a single 2x2 transform about the centroid
+        transform = None
         if scale_short_axis and width > 0 and height > 0:
             # Start with base factors
             if is_width_dominant:
@@ -569,17 +637,9 @@ def scale_boundary_for_cutout(
                 x_factor = scale_short_factor  # Width is shorter
                 y_factor = scale_long_factor  # Height is longer - always scale it
 
-            scaled_aligned_poly = affinity.scale(
-                aligned_poly, xfact=x_factor, yfact=y_factor, origin=centroid_coords
-            )
-            scaled_poly = affinity.rotate(
-                scaled_aligned_poly, -rotation_angle, origin=centroid_coords, use_radians=False
-            )
+            transform = align.T @ np.diag([x_factor, y_factor]) @ align
 
-            theta = np.radians(-rotation_angle)
-            rotation_matrix = np.array(
-                [[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]]
-            )
+            rotation_matrix = align.T
             scale_axis_local = np.array([0.0, 1.0]) if is_width_dominant else np.array([1.0, 0.0])
             scale_axis_vector = rotation_matrix @ scale_axis_local
 
@@ -602,27 +662,27 @@ def scale_boundary_for_cutout(
                 x_factor = 1.0  # Width is shorter
                 y_factor = scale_long_factor  # Height is longer
 
-            scaled_aligned_poly = affinity.scale(
-                aligned_poly, xfact=x_factor, yfact=y_factor, origin=centroid_coords
-            )
-            scaled_poly = affinity.rotate(
-                scaled_aligned_poly, -rotation_angle, origin=centroid_coords, use_radians=False
-            )
+            transform = align.T @ np.diag([x_factor, y_factor]) @ align
         elif not scale_short_axis and not scale_long_axis:
             # Uniform scaling if neither axis-specific scaling is requested
-            scaled_poly = affinity.scale(
-                boundary_poly,
-                xfact=scale_short_factor,
-                yfact=scale_short_factor,
-                origin=centroid_coords,
+            transform = np.diag([scale_short_factor, scale_short_factor])
+
+        if transform is not None:
+            scaled_poly = shapely.transform(
+                boundary_poly, lambda xy: (xy - boundary_centroid) @ transform.T + boundary_centroid
             )
 
         # TEMP: visualization for debugging orthogonal scaling
         if debug:
+            # NOTE: imported lazily; slow to import and only used for debug visualizations
+            from matplotlib.figure import Figure
+            from PIL import Image
+
             x, y = boundary_poly.exterior.xy
             sx, sy = scaled_poly.exterior.xy
 
-            fig, ax = plt.subplots()
+            fig = Figure()
+            ax = fig.add_subplot()
             ax.plot(
                 x,
                 y,
@@ -671,8 +731,7 @@ def scale_boundary_for_cutout(
             )
             debug_path = debug_dir / debug_filename
 
-            plt.savefig(debug_path, format="png", dpi=150)
-            plt.close(fig)
+            fig.savefig(debug_path, format="png", dpi=150)
 
             with Image.open(debug_path) as debug_image:
                 print(
@@ -691,98 +750,69 @@ def scale_boundary_for_cutout(
     return expanded_boundary
 
 
-def longest_edge_angle(polygon: Polygon | list[Vector2]) -> float:
-    """
-    Calculate the angle of the longest edge in a polygon.
-    Useful for determining the orientation of rectangular features like doors or windows.
-
-    Args:
-        polygon: Shapely Polygon object or list of Vector2 points
-
-    Returns:
-        Angle in degrees (from X-axis, counterclockwise) of the longest edge
-    """
-    # Convert to coordinate list
-    if isinstance(polygon, Polygon):
-        coords = list(polygon.exterior.coords[:-1])  # Exclude duplicate last point
-    elif isinstance(polygon, list) and isinstance(polygon[0], Vector2):
-        coords = [(v.x, v.y) for v in polygon]
-    else:
-        raise TypeError("Expected shapely Polygon or list[Vector2]")
-
-    max_length = 0
-    angle = 0.0
-
-    for i in range(len(coords)):
-        p1 = coords[i]
-        p2 = coords[(i + 1) % len(coords)]
-
-        # Calculate edge vector and length
-        dx = p2[0] - p1[0]
-        dy = p2[1] - p1[1]
-        length = math.sqrt(dx**2 + dy**2)
-
-        # Track the longest edge and its angle
-        if length > max_length:
-            max_length = length
-            # Calculate angle in degrees (from X-axis, counterclockwise)
-            angle = math.degrees(math.atan2(dy, dx))
-
-    return angle
+def _rotation_matrix(angle_degrees: float) -> np.ndarray:
+    """2x2 counterclockwise rotation matrix."""
+    angle_rad = np.deg2rad(angle_degrees)
+    cos_a = np.cos(angle_rad)
+    sin_a = np.sin(angle_rad)
+    return np.array([[cos_a, -sin_a], [sin_a, cos_a]])
 
 
 def get_dominant_angle(
-    polygons: list[Polygon] | list[list[Vector2]], strategy: str = "length_weighted"
+    polygons: list[Polygon] | list[list[Vector2]] | list[np.ndarray],
+    strategy: str = "length_weighted",
 ) -> float:
     """
     Calculate the dominant angle of a set of polygons for orientation normalization.
 
     Args:
-        polygons: List of shapely Polygon objects or list of list[Vector2] boundaries
+        polygons: List of shapely Polygon objects, list[Vector2] boundaries, or (N, 2) arrays
         strategy: 'length_weighted' (robust to segmentation), 'count', or 'complex_sum' (length-weighted; more precise)
 
     Returns:
         Correction angle in degrees to rotate for axis alignment
     """
-    angles = []
-    edge_lengths = []
-
+    # Convert to numpy arrays based on input type
+    coords_list = []
     for poly in polygons:
-        # Convert to numpy array based on input type
         if isinstance(poly, Polygon):
-            coords = np.array(poly.exterior.coords)
+            coords_list.append(np.array(poly.exterior.coords)[:, :2])
         elif isinstance(poly, list) and isinstance(poly[0], Vector2):
-            coords = np.array([(v.x, v.y) for v in poly])
+            coords_list.append(np.array([(v.x, v.y) for v in poly]))
+        elif isinstance(poly, np.ndarray):
+            coords_list.append(poly)
         else:
-            raise TypeError("Expected shapely Polygon or list[Vector2]")
+            raise TypeError("Expected shapely Polygon, list[Vector2], or ndarray")
 
-        vectors = np.diff(coords, axis=0)
-        edge_angles = np.arctan2(vectors[:, 1], vectors[:, 0])
-        edge_angles_deg = np.rad2deg(edge_angles) % 180
-        lengths = np.linalg.norm(vectors, axis=1)
+    # Edge vectors of all polygons in one pass, dropping the bogus edges between consecutive
+    # polygons (i.e., from the last vertex of one polygon to the first vertex of the next)
+    coords = np.concatenate(coords_list) if coords_list else np.empty((0, 2))
+    poly_starts = np.cumsum([len(c) for c in coords_list], dtype=np.intp)[:-1]
+    poly_starts = poly_starts[(poly_starts > 0) & (poly_starts < len(coords))]  # empty polygons
+    vectors = np.delete(np.diff(coords, axis=0), poly_starts - 1, axis=0)
 
-        angles.extend(edge_angles_deg)
-        edge_lengths.extend(lengths)
+    edge_angles_deg = np.rad2deg(np.arctan2(vectors[:, 1], vectors[:, 0])) % 180
+    edge_lengths = np.linalg.norm(vectors, axis=1)
 
     # Normalize to [0, 90) to treat parallel/perpendicular lines the same
-    normalized_angles = np.array([angle % 90 for angle in angles])
+    normalized_angles = edge_angles_deg % 90
     normalized_angles_rad = np.radians(normalized_angles)
 
+    # 1° histogram bins over [0, 90]; the bin index is just the truncated angle
+    bin_edges = np.arange(91, dtype=np.float64)
+    bin_indices = np.minimum(normalized_angles.astype(np.intp), 89)
+
     # Compute histogram with optional weighting
     if strategy == "length_weighted":
-        hist, bin_edges = np.histogram(
-            normalized_angles, bins=90, range=(0, 90), weights=edge_lengths
-        )
+        hist = np.bincount(bin_indices, weights=edge_lengths, minlength=90)
         dominant_angle_bin = np.argmax(hist)
         dominant_angle = bin_edges[dominant_angle_bin] + 0.5
     elif strategy == "complex_sum":
         # NOTE: based on `length_weighted`, but applies averaging afterwards to
         #       combat histogram-induced bin truncation.
-        weights = np.array(edge_lengths)
-        hist, bin_edges = np.histogram(normalized_angles, bins=90, range=(0, 90), weights=weights)
+        weights = edge_lengths
+        hist = np.bincount(bin_indices, weights=weights, minlength=90)
         dominant_angle_bin = int(np.argmax(hist))
-        bin_indices = np.digitize(normalized_angles, bin_edges, right=False) - 1
-        bin_indices = np.clip(bin_indices, 0, len(hist) - 1)
         bin_mask = bin_indices == dominant_angle_bin
         if not np.any(bin_mask):
             bin_mask = np.ones_like(normalized_angles, dtype=bool)
@@ -806,7 +836,7 @@ def get_dominant_angle(
                 if dominant_angle > 90:
                     dominant_angle = 180 - dominant_angle
     elif strategy == "count":
-        hist, bin_edges = np.histogram(normalized_angles, bins=90, range=(0, 90))
+        hist = np.bincount(bin_indices, minlength=90)
         dominant_angle_bin = np.argmax(hist)
         dominant_angle = bin_edges[dominant_angle_bin] + 0.5
     else:
@@ -821,6 +851,24 @@ def get_dominant_angle(
     return correction_angle
 
 
+def _boundary_to_xy(boundary: list[Vector2] | np.ndarray) -> np.ndarray:
+    """Packs a boundary into an (N, 2) float64 array (arrays are passed through)."""
+    if isinstance(boundary, np.ndarray):
+        return boundary
+    return np.array([(v.x, v.y) for v in boundary], dtype=np.float64).reshape(-1, 2)
+
+
+def _closed_ring_xy(boundary: list[Vector2] | np.ndarray) -> np.ndarray:
+    """Packs a boundary into an (N + 1, 2) array with the first point repeated at the end."""
+    xy = _boundary_to_xy(boundary)
+    return np.concatenate([xy, xy[:1]])
+
+
+def _xy_to_boundary(xy: np.ndarray) -> list[Vector2]:
+    """Unpacks an (N, 2) array into a boundary."""
+    return [Vector2(x=x, y=y) for x, y in xy.tolist()]
+
+
 def rotate_boundary(
     boundary: list[Vector2], angle_degrees: float, origin: tuple[float, float] = (0.0, 0.0)
 ) -> list[Vector2]:
@@ -828,44 +876,29 @@ def rotate_boundary(
     if not boundary:
         return boundary
 
-    # Convert to radians
-    angle_rad = np.deg2rad(angle_degrees)
-    cos_a = np.cos(angle_rad)
-    sin_a = np.sin(angle_rad)
-
-    # Rotation matrix
-    ox, oy = origin
-
-    rotated = []
-    for v in boundary:
-        # Translate to origin
-        x = v.x - ox
-        y = v.y - oy
+    return _xy_to_boundary(_rotate_xy(_boundary_to_xy(boundary), angle_degrees, origin))
 
-        # Rotate
-        x_new = x * cos_a - y * sin_a
-        y_new = x * sin_a + y * cos_a
 
-        # Translate back
-        rotated.append(Vector2(x=x_new + ox, y=y_new + oy))
+def _rotate_xy(xy: np.ndarray, angle_degrees: float, origin: tuple[float, float]) -> np.ndarray:
+    """`rotate_boundary()` on an (N, 2) array."""
+    # Rotation matrix (transposed, as points are rows)
+    rotation_t = _rotation_matrix(angle_degrees).T
+    origin_xy = np.asarray(origin, dtype=np.float64)
 
-    return rotated
+    # Translate to origin, rotate, and translate back in one pass over all vertices
+    return (xy - origin_xy) @ rotation_t + origin_xy
 
 
-def calculate_floor_plan_centroid(boundaries: list[list[Vector2]]) -> tuple[float, float]:
+def calculate_floor_plan_centroid(
+    boundaries: list[list[Vector2]] | list[np.ndarray],
+) -> tuple[float, float]:
     """Calculate the centroid of all boundaries for use as rotation/scaling origin."""
-    all_x: list[float] = []
-    all_y: list[float] = []
-
-    for boundary in boundaries:
-        for v in boundary:
-            all_x.append(v.x)
-            all_y.append(v.y)
-
-    if not all_x:
+    xys = [_boundary_to_xy(boundary) for boundary in boundaries]
+    if not any(len(xy) for xy in xys):
         return (0.0, 0.0)
 
-    return (sum(all_x) / len(all_x), sum(all_y) / len(all_y))
+    x, y = np.concatenate(xys).mean(axis=0).tolist()
+    return (x, y)
 
 
 def scale_boundary(
@@ -875,22 +908,39 @@ def scale_boundary(
     if not boundary:
         return boundary
 
-    ox, oy = origin
+    return _xy_to_boundary(_scale_xy(_boundary_to_xy(boundary), scale_factor, origin))
 
-    scaled: list[Vector2] = []
-    for v in boundary:
-        # Translate to origin
-        x = v.x - ox
-        y = v.y - oy
 
-        # Scale
-        x_new = x * scale_factor
-        y_new = y * scale_factor
+def _scale_xy(xy: np.ndarray, scale_factor: float, origin: tuple[float, float]) -> np.ndarray:
+    """`scale_boundary()` on an (N, 2) array."""
+    origin_xy = np.asarray(origin, dtype=np.float64)
 
-        # Translate back
-        scaled.append(Vector2(x=x_new + ox, y=y_new + oy))
+    # Translate to origin, scale, and translate back in one pass over all vertices
+    return (xy - origin_xy) * scale_factor + origin_xy
 
-    return scaled
+
+def _transform_floor_plan(rooms: list[Room], transform_xy: Callable[[np.ndarray], np.ndarray]):
+    """
+    Applies an (N, 2) -> (N, 2) array transform to every room and structure boundary at once.
+
+    All boundaries are packed into a single array, transformed together, and only turned back into
+    `Vector2`s when written back to the rooms/structures.
+    """
+    owners = []
+    for room in rooms:
+        if room.boundary:
+            owners.append(room)
+        for s in room.structure or []:
+            if s.boundary:
+                owners.append(s)
+    if not owners:
+        return
+
+    xys = [_boundary_to_xy(owner.boundary) for owner in owners]
+    splits = np.cumsum([len(xy) for xy in xys])[:-1]
+    transformed = np.split(transform_xy(np.concatenate(xys)), splits)
+    for owner, xy in zip(owners, transformed):
+        owner.boundary = _xy_to_boundary(xy)
 
 
 def scale_floor_plan(
@@ -910,12 +960,7 @@ def scale_floor_plan(
         origin = calculate_floor_plan_centroid(room_boundaries)
 
     # Scale each room's boundary and structures
-    for room in rooms:
-        room.boundary = scale_boundary(room.boundary, scale_factor, origin=origin)
-        if room.structure:
-            for s in room.structure:
-                if s.boundary:
-                    s.boundary = scale_boundary(s.boundary, scale_factor, origin=origin)
+    _transform_floor_plan(rooms, lambda xy: _scale_xy(xy, scale_factor, origin))
 
     return rooms
 
@@ -934,21 +979,17 @@ def normalize_floor_plan_orientation(
     if not rooms:
         return rooms, 0.0
 
-    # Calculate orientation correction angle
+    # Calculate orientation correction angle (packing each room boundary only once)
     room_boundaries = [room.boundary for room in rooms]
-    correction_angle = get_dominant_angle(room_boundaries, strategy=strategy)
+    room_xys = [_boundary_to_xy(boundary) for boundary in room_boundaries if boundary]
+    correction_angle = get_dominant_angle(room_xys, strategy=strategy)
 
     # Apply rotation if angle is significant
     if abs(correction_angle) > angle_threshold:
-        centroid = calculate_floor_plan_centroid(room_boundaries)
+        centroid = calculate_floor_plan_centroid(room_xys)
 
         # Rotate each room's boundary and structures
-        for room in rooms:
-            room.boundary = rotate_boundary(room.boundary, correction_angle, origin=centroid)
-            if room.structure:
-                for s in room.structure:
-                    if s.boundary:
-                        s.boundary = rotate_boundary(s.boundary, correction_angle, origin=centroid)
+        _transform_floor_plan(rooms, lambda xy: _rotate_xy(xy, correction_angle, centroid))
 
     return rooms, correction_angle
 
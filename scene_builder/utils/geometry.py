@@ -4,7 +4,7 @@ import math
 from pathlib import Path
 from typing import Iterable
 
-import matplotlib.pyplot as plt
+import numpy as np
 from shapely.geometry import LineString, Point, Polygon
 from shapely.geometry.base import BaseGeometry
 
@@ -42,30 +42,19 @@ def longest_edge_angle(polygon: Polygon | list[Vector2]) -> float:
     Accepts a shapely Polygon or a list of Vector2 points.
     Returns angle in degrees from X-axis (counterclockwise).
     """
-    # Convert to coordinate list
+    # Convert to coordinate array
     if isinstance(polygon, Polygon):
-        coords = list(polygon.exterior.coords[:-1])  # Exclude duplicate last point
+        coords = np.asarray(polygon.exterior.coords)[:-1, :2]  # Exclude duplicate last point
     elif isinstance(polygon, list) and polygon and isinstance(polygon[0], Vector2):
-        coords = [(v.x, v.y) for v in polygon]
+        coords = np.array([(v.x, v.y) for v in polygon], dtype=float)
     else:
         raise TypeError("Expected shapely Polygon or list[Vector2]")
 
-    max_length = 0.0
-    angle = 0.0
-
-    for i in range(len(coords)):
-        p1 = coords[i]
-        p2 = coords[(i + 1) % len(coords)]
-
-        dx = p2[0] - p1[0]
-        dy = p2[1] - p1[1]
-        length = math.hypot(dx, dy)
-
-        if length > max_length:
-            max_length = length
-            angle = math.degrees(math.atan2(dy, dx))
-
-    return angle
+    # Edge vectors (incl. the closing edge); the first longest edge wins, as `argmax` picks the
+    # first maximum
+    edges = np.roll(coords, -1, axis=0) - coords
+    i = int(np.einsum("ij,ij->i", edges, edges).argmax())
+    return math.degrees(math.atan2(edges[i, 1], edges[i, 0]))
 
 
 def longest_edge_direction(polygon: Polygon | list[Vector2]) -> tuple[float, float] | None:
@@ -604,8 +593,12 @@ def save_polygon_image(
     coords = [(v.x, v.y) for v in vertices]
     polygon = Polygon(coords)
 
-    # Create figure and axis
-    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+    # NOTE: imported lazily; slow to import and only used here
+    from matplotlib.figure import Figure
+
+    # Create figure and axis (outside of pyplot, so its figure registry doesn't keep it alive)
+    fig = Figure(figsize=figsize, dpi=dpi)
+    ax = fig.add_subplot()
 
     # Plot polygon
     x, y = polygon.exterior.xy
@@ -637,9 +630,8 @@ def save_polygon_image(
     ax.set_title(f"Polygon ({len(vertices)} vertices)")
 
     # Save figure
-    plt.tight_layout()
-    plt.savefig(output_path, format=format, dpi=dpi, bbox_inches="tight")
-    plt.close(fig)
+    fig.tight_layout()
+    fig.savefig(output_path, format=format, dpi=dpi, bbox_inches="tight")
 
     return output_path
 
@@ -684,11 +676,9 @@ def calculate_bounds_2d(
             "has_area": False,
         }
 
-    x_coords = [x for x, y in vertices_2d]
-    y_coords = [y for x, y in vertices_2d]
-
-    min_x, max_x = min(x_coords), max(x_coords)
-    min_y, max_y = min(y_coords), max(y_coords)
+    coords = np.asarray(vertices_2d, dtype=np.float64)
+    min_x, min_y = (float(v) for v in coords.min(axis=0))
+    max_x, max_y = (float(v) for v in coords.max(axis=0))
     width = max_x - min_x
     height = max_y - min_y
     area = width * height
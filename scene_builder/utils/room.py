@@ -3,7 +3,6 @@
 from pathlib import Path
 from typing import Iterable
 
-import matplotlib.pyplot as plt
 from shapely.geometry.base import BaseGeometry
 
 from scene_builder.definition.scene import Room, Structure, Vector2, Vector3
@@ -127,6 +126,9 @@ def assign_structures_to_rooms(
             continue
         room_geometries.append((room, geom))
 
+    # Ids of the structures already on each room (by object id), for O(1) duplicate checks
+    structure_ids: dict[int, set[str]] = {}
+
     for structure in structures:
         structure_geom = boundary_to_geometry(structure.boundary)
         if structure_geom is None:
@@ -143,8 +145,13 @@ def assign_structures_to_rooms(
             if distance <= distance_threshold:
                 if room.structure is None:
                     room.structure = []
-                if not any(existing.id == structure.id for existing in room.structure):
+                room_structure_ids = structure_ids.get(id(room))
+                if room_structure_ids is None:
+                    room_structure_ids = {existing.id for existing in room.structure}
+                    structure_ids[id(room)] = room_structure_ids
+                if structure.id not in room_structure_ids:
                     room.structure.append(structure)
+                    room_structure_ids.add(structure.id)
                 attachments.append((structure.id, room.id))
                 attached = True
 
@@ -207,11 +214,17 @@ def render_structure_links(
             continue
         structure_geoms[structure.id] = geom
 
-    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+    # NOTE: imported lazily; slow to import and only used here
+    import matplotlib
+    from matplotlib.figure import Figure
+
+    # NOTE: not created through pyplot, so not kept alive by its figure registry (no close)
+    fig = Figure(figsize=figsize, dpi=dpi)
+    ax = fig.add_subplot()
 
     # Draw rooms
     room_colors: dict[str, str] = {}
-    base_colors = plt.rcParams["axes.prop_cycle"].by_key().get("color", ["tab:blue"])
+    base_colors = matplotlib.rcParams["axes.prop_cycle"].by_key().get("color", ["tab:blue"])
     for idx, (room_id, geom) in enumerate(room_geoms.items()):
         room_color = base_colors[idx % len(base_colors)]
         room_colors[room_id] = room_color
@@ -321,7 +334,6 @@ def render_structure_links(
 
     fig.tight_layout()
     fig.savefig(output_path, bbox_inches="tight")
-    plt.close(fig)
 
     logger.debug("Saved room/structure association debug image to %s", output_path)
     return output_path
@@ -1,4 +1,6 @@
-from scene_builder.decoder.blender.blender import parse_scene_definition, save_scene
+import bpy
+
+from scene_builder.decoder.blender.blender import _clear_scene, parse_scene_definition, save_scene
 from scene_builder.definition.scene import Scene
 from scene_builder.utils.conversions import pydantic_from_yaml
 
@@ -10,6 +12,20 @@ def test_scene_building():
     print("\nBlender scene created successfully from YAML data.")
 
 
+def test_clear_scene_only_removes_scene_objects_and_their_meshes():
+    removed = bpy.data.meshes.new("test_clear_removed")
+    bpy.context.scene.collection.objects.link(bpy.data.objects.new("test_clear_obj", removed))
+    kept = bpy.data.meshes.new("test_clear_kept")  # held by a caller, no users
+    material = bpy.data.materials.new("test_clear_material")
+
+    _clear_scene()
+
+    assert len(bpy.context.scene.objects) == 0
+    assert "test_clear_removed" not in bpy.data.meshes
+    assert bpy.data.meshes.get("test_clear_kept") == kept
+    assert bpy.data.materials.get("test_clear_material") == material
+
+
 if __name__ == "__main__":
     test_scene_building()
 
@@ -3,7 +3,7 @@ import yaml
 from pathlib import Path
 from pydantic import BaseModel
 
-from scene_builder.utils.conversions import pydantic_from_yaml
+from scene_builder.utils.conversions import load_yaml, pydantic_from_yaml
 
 
 class TestPydanticFromYaml(unittest.TestCase):
@@ -32,5 +32,26 @@ class TestPydanticFromYaml(unittest.TestCase):
         self.assertEqual(model_instance.value, 123)
 
 
+class TestLoadYaml(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path("test_temp")
+        self.test_dir.mkdir(exist_ok=True)
+
+    def tearDown(self):
+        for item in self.test_dir.iterdir():
+            item.unlink()
+        self.test_dir.rmdir()
+
+    def test_matches_safe_load(self):
+        data = {"rooms": [{"id": "room-01", "boundary": [{"x": 0.0, "y": 1.5}]}]}
+        file_path = self.test_dir / "scene.yaml"
+        with open(file_path, "w") as f:
+            yaml.dump(data, f)
+
+        with open(file_path, "r") as f:
+            expected = yaml.safe_load(f)
+        self.assertEqual(load_yaml(file_path), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
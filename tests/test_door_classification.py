@@ -0,0 +1,46 @@
+from shapely.geometry import Polygon, box
+
+from scene_builder.utils.floorplan import (
+    _build_entity_tree,
+    classify_door_type,
+    classify_door_types,
+)
+
+# Two rooms sharing the wall at x=4; a door in that wall touches both, a door in the outer wall
+# only one
+ROOMS = [box(0, 0, 4, 3), box(4, 0, 8, 3)]
+INTERIOR_DOOR = box(3.95, 1, 4.05, 2)
+EXTERIOR_DOOR = box(-0.1, 1, 0, 2)
+DETACHED_DOOR = box(20, 20, 21, 21)
+INVALID_DOOR = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])  # self-intersecting bowtie
+
+
+def test_classify_door_type():
+    assert classify_door_type(INTERIOR_DOOR, ROOMS) == "interior"
+    assert classify_door_type(EXTERIOR_DOOR, ROOMS) == "exterior"
+    assert classify_door_type(DETACHED_DOOR, ROOMS) == "exterior"
+    assert classify_door_type(INVALID_DOOR, ROOMS) == "exterior"
+    assert classify_door_type(INTERIOR_DOOR, []) == "exterior"
+
+
+def test_classify_door_type_proximity_threshold():
+    gap_door = box(4.1, 1, 4.2, 2)  # inside the second room, 0.1m from the first
+    assert classify_door_type(gap_door, ROOMS) == "exterior"
+    assert classify_door_type(gap_door, ROOMS, proximity_threshold=0.2) == "interior"
+
+
+def test_classify_door_type_skips_invalid_entities():
+    # A self-intersecting entity touching the door is ignored, so only the first room counts
+    invalid_room = Polygon([(4, 1), (5, 2), (5, 1), (4, 2)])
+    entities = ROOMS[:1] + [invalid_room, Polygon()]
+    assert classify_door_type(INTERIOR_DOOR, entities) == "exterior"
+
+
+def test_classify_door_types_matches_single_door():
+    doors = [INTERIOR_DOOR, EXTERIOR_DOOR, DETACHED_DOOR, INVALID_DOOR]
+    tree = _build_entity_tree(ROOMS)
+
+    expected = [classify_door_type(door, ROOMS, entity_tree=tree) for door in doors]
+    assert expected == ["interior", "exterior", "exterior", "exterior"]
+    assert classify_door_types(doors, ROOMS) == expected
+    assert classify_door_types([], ROOMS) == []
@@ -0,0 +1,36 @@
+import pytest
+
+from scene_builder.utils.file import MAX_INCREMENT, get_filename
+
+
+def test_get_filename_increments_past_existing_files(tmp_path):
+    first = get_filename(tmp_path, "render_top_down", "jpg")
+    assert first.endswith("render_top_down_0.jpg")
+
+    # Nothing written yet: the next call must still hand out a new name
+    second = get_filename(tmp_path, "render_top_down", "jpg")
+    assert second.endswith("render_top_down_1.jpg")
+
+    # Files created outside of get_filename are skipped
+    (tmp_path / "render_top_down_2.jpg").touch()
+    third = get_filename(tmp_path, "render_top_down", "jpg")
+    assert third.endswith("render_top_down_3.jpg")
+
+
+def test_get_filename_wraps_around_to_free_indices(tmp_path):
+    # More calls than there are indices, with nothing written: free indices are reused
+    names = [get_filename(tmp_path, "render", "png") for _ in range(MAX_INCREMENT + 5)]
+    assert names[MAX_INCREMENT - 1].endswith(f"render_{MAX_INCREMENT - 1}.png")
+    assert names[MAX_INCREMENT].endswith("render_0.png")
+
+    # Taken indices are still skipped after wrapping around
+    (tmp_path / "render_5.png").touch()
+    assert get_filename(tmp_path, "render", "png").endswith("render_6.png")
+
+
+def test_get_filename_raises_when_all_indices_are_taken(tmp_path):
+    for i in range(MAX_INCREMENT):
+        (tmp_path / f"full_{i}.png").touch()
+
+    with pytest.raises(FileExistsError):
+        get_filename(tmp_path, "full", "png")
@@ -1,8 +1,10 @@
+import numpy as np
 import pytest
 from pathlib import Path
 
 from scene_builder.decoder.blender import blender
 from scene_builder.definition.scene import Vector2
+from shapely.geometry import Point, Polygon
 
 def test_floor_mesh():
     boundary = [Vector2(x=4,y=2), Vector2(x=-4,y=2), Vector2(x=-4,y=-2), Vector2(x=4,y=-2)] 
@@ -18,6 +20,62 @@ def test_bound_calculation():
     
 
 
+# L-shaped (non-convex) room, listed clockwise
+L_SHAPE = [
+    Vector2(x=0, y=0), Vector2(x=0, y=3), Vector2(x=1, y=3),
+    Vector2(x=1, y=1), Vector2(x=3, y=1), Vector2(x=3, y=0),
+]
+
+
+def _face_normals(arrays, faces):
+    """Unnormalized normals of the triangles/quads in `faces` (from their first three vertices)"""
+    tris = arrays["verts"][np.asarray([face[:3] for face in faces])]
+    return np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+
+
+def test_build_floor_arrays_winding_and_normals():
+    arrays = blender._build_floor_arrays(L_SHAPE, floor_thickness_m=0.1)
+    num_verts = len(L_SHAPE)
+    num_tris = num_verts - 2
+
+    assert arrays["verts"].shape == (2 * num_verts, 3)
+    assert arrays["area"] == pytest.approx(5.0)
+    faces = arrays["faces"]
+    assert len(faces) == 2 * num_tris + num_verts
+
+    # Top faces point up and bottom faces down, whatever the input winding
+    top_normals = _face_normals(arrays, faces[:num_tris])
+    bottom_normals = _face_normals(arrays, faces[num_tris : 2 * num_tris])
+    assert (top_normals[:, 2] > 0).all()
+    assert (bottom_normals[:, 2] < 0).all()
+    assert top_normals[:, 2].sum() / 2 == pytest.approx(5.0)
+
+    # Side quads are vertical and face away from the room (centered on the origin)
+    side_faces = faces[2 * num_tris :]
+    side_normals = _face_normals(arrays, side_faces)
+    side_centers = np.array([arrays["verts"][face].mean(axis=0) for face in side_faces])
+    assert np.allclose(side_normals[:, 2], 0)
+    polygon = Polygon([(p.x, p.y) for p in L_SHAPE])
+    offset = np.asarray(arrays["origin_offset"])
+    for center, normal in zip(side_centers, side_normals):
+        outside = center[:2] + offset[:2] + 0.01 * normal[:2] / np.linalg.norm(normal[:2])
+        assert not polygon.contains(Point(outside))
+
+
+def test_build_floor_arrays_top_only():
+    arrays = blender._build_floor_arrays(list(reversed(L_SHAPE)), top_only=True)
+
+    assert arrays["verts"].shape == (len(L_SHAPE), 3)
+    assert np.allclose(arrays["verts"][:, 2], 0)
+    assert len(arrays["faces"]) == len(L_SHAPE) - 2
+    assert (_face_normals(arrays, arrays["faces"])[:, 2] > 0).all()
+
+
+def test_build_floor_arrays_degenerate_boundary():
+    boundary = [Vector2(x=0, y=0), Vector2(x=1, y=0), Vector2(x=1, y=0), Vector2(x=0, y=0)]
+    assert blender._build_floor_arrays(boundary) is None
+
+
 if __name__ == "__main__":
     test_floor_mesh()
     test_bound_calculation()
\ No newline at end of file
@@ -0,0 +1,99 @@
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("msd")
+pytest.importorskip("pyarrow")
+
+from scene_builder.importer.msd.loader import MSDLoader  # noqa: E402
+
+SUBTYPES = ["BEDROOM", "KITCHEN", "DOOR"]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """Small MSD-like CSV: 2 buildings with 2 apartments each, 3 entities per apartment"""
+    rows = []
+    for apt in range(4):
+        building_id = apt // 2
+        for k, subtype in enumerate(SUBTYPES):
+            rows.append(
+                dict(
+                    apartment_id=f"apt{apt}",
+                    building_id=building_id,
+                    floor_id=f"floor{building_id}",
+                    entity_type="opening" if subtype == "DOOR" else "area",
+                    entity_subtype=subtype,
+                    roomtype=subtype.title(),
+                    geom=f"POLYGON (({k} 0, {k + 1} 0, {k + 1} 2, {k} 2, {k} 0))",
+                    unused_column=1,
+                )
+            )
+    # Entity without a geometry
+    rows.append(dict(rows[0], entity_subtype="BEDROOM", geom=None))
+
+    path = tmp_path / "msd.csv"
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return path
+
+
+def test_read_df_writes_and_reuses_parquet_snapshot(csv_path):
+    loader = MSDLoader(str(csv_path))
+    assert not loader._has_fresh_cache()
+
+    df = loader.df
+    assert loader.cache_path.exists()
+    assert loader._has_fresh_cache()
+    assert "unused_column" not in df.columns
+    assert df["entity_subtype"].dtype == "category"
+
+    # A second loader reads the snapshot instead of the CSV
+    cached_df = MSDLoader(str(csv_path)).df
+    pd.testing.assert_frame_equal(cached_df, df)
+
+
+def test_stale_parquet_snapshot_is_rebuilt(csv_path):
+    MSDLoader(str(csv_path)).df
+    cache_path = csv_path.with_suffix(".parquet")
+    csv_mtime = csv_path.stat().st_mtime
+    os.utime(cache_path, (csv_mtime - 10, csv_mtime - 10))
+
+    loader = MSDLoader(str(csv_path))
+    assert not loader._has_fresh_cache()
+    loader.df
+    assert loader._has_fresh_cache()
+
+
+def test_load_building_reads_only_its_rows(csv_path):
+    MSDLoader(str(csv_path)).df  # write the snapshot
+
+    loader = MSDLoader(str(csv_path))
+    building = loader._load_building(1)
+    assert loader._df is None  # served from the snapshot, without loading the full table
+    assert set(building["building_id"]) == {1}
+    assert sorted(building["apartment_id"].unique()) == ["apt2", "apt3"]
+
+    # Same rows once `df` is loaded
+    loaded_building = loader.df.iloc[loader._rows_by_building[1]]
+    pd.testing.assert_frame_equal(
+        building.reset_index(drop=True), loaded_building.reset_index(drop=True)
+    )
+    assert loader.get_apartments_in_building(99) == []
+
+
+def test_create_graph_sb_format(csv_path):
+    loader = MSDLoader(str(csv_path))
+    graph = loader.create_graph("apt1", format="sb")
+
+    assert graph.graph["apartment_id"] == "apt1"
+    assert graph.graph["floor_id"] == "floor0"
+    # Entities without a geometry are skipped
+    assert graph.number_of_nodes() == len(SUBTYPES)
+
+    nodes = dict(graph.nodes(data=True))
+    assert [nodes[idx]["entity_subtype"] for idx in sorted(nodes)] == SUBTYPES
+    assert nodes[1]["geometry"] == [(1, 0), (2, 0), (2, 2), (1, 2), (1, 0)]
+    assert nodes[1]["centroid"] == pytest.approx((1.5, 1.0))
+
+    assert loader.create_graph("missing_apartment", format="sb") is None
@@ -2,10 +2,11 @@
 Tests: MSD Building → SceneBuilder → Blender (.blend file)
 """
 
-from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 
+import matplotlib.pyplot as plt
+
 from scene_builder.decoder.blender import blender
 from scene_builder.definition.scene import Scene
 from scene_builder.importer.msd.loader import MSDLoader
@@ -43,15 +44,9 @@ def _enable_addons(enable_doors=True, enable_windows=True):
 
 def _collect_building_floors(
     loader: MSDLoader, building_id: int, floor_filter: Optional[str] = None
-):
-    apartments = loader.get_apartments_in_building(building_id, floor_id=floor_filter)
-    floors: dict[str, list[tuple[str, object]]] = defaultdict(list)
-
-    for apt_id in apartments:
-        graph = loader.create_graph(apt_id, format="sb")
-        floor_id = graph.graph.get("floor_id")
-        floors[floor_id].append((apt_id, graph))
-    return floors
+) -> dict[str, list[str]]:
+    # NOTE: only groups apartment ids; graphs are built per floor while iterating
+    return loader.get_apartment_floors(building_id, floor_id=floor_filter)
 
 
 def _render_structure_links_for_rooms(rooms_dict: list, output_path: Path) -> bool:
@@ -106,9 +101,13 @@ def test_msd_to_blender(
     floors = _collect_building_floors(loader, building_id, floor_filter=floor_id)
     print(f"Found {sum(len(v) for v in floors.values())} apartments across {len(floors)} floors\n")
 
+    # One figure for all floor plan visualizations (redrawn per floor/apartment)
+    fig, floor_plan_ax = plt.subplots(figsize=(12, 12))
+
     # Process each floor
-    for floor_id, apt_graphs in floors.items():
-        print(f"Floor {floor_id}: {len(apt_graphs)} apartments")
+    for floor_id, apartments in floors.items():
+        print(f"Floor {floor_id}: {len(apartments)} apartments")
+        apt_graphs = [(apt_id, loader.create_graph(apt_id, format="sb")) for apt_id in apartments]
 
         if entire_floor:
             # Aggregate all rooms across apartments into a single floor-level scene
@@ -126,7 +125,7 @@ def test_msd_to_blender(
             )
 
             floor_plan_viz = OUTPUT_DIR / f"msd_building_{building_id}_floor_{floor_id}_floor_plan.png"
-            plot_floor_plan(all_rooms, str(floor_plan_viz))
+            plot_floor_plan(all_rooms, str(floor_plan_viz), ax=floor_plan_ax)
             print(f"   ✓ Floor plan visualization: {floor_plan_viz.name}")
 
             scene_data = recenter_scene(floor_scene, rotate=align_rotation)
@@ -175,7 +174,7 @@ def test_msd_to_blender(
 
                 apt_prefix = str(apt_id)[:8]
                 apt_viz = OUTPUT_DIR / f"msd_building_{building_id}_floor_{floor_id}_apt_{apt_prefix}_floor_plan.png"
-                plot_floor_plan(apt_scene.rooms, str(apt_viz))
+                plot_floor_plan(apt_scene.rooms, str(apt_viz), ax=floor_plan_ax)
                 print(f"   ✓ Floor plan visualization: {apt_viz.name}")
 
                 scene_data = recenter_scene(apt_scene, rotate=align_rotation)
@@ -219,6 +218,8 @@ def test_msd_to_blender(
                 )
                 print(f"   ✓ Rendered: {render_path.name}")
 
+    plt.close(fig)
+
 
 if __name__ == "__main__":
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)